@@ -1,10 +1,14 @@
 """AI-powered natural language schedule parsing using Anthropic Claude."""
 
-import json
+import asyncio
 import os
+import re
+import time
+from collections import OrderedDict
 from typing import Any, Dict, List, Optional
 
-from anthropic import Anthropic
+import orjson
+from anthropic import AsyncAnthropic
 from pydantic import BaseModel
 
 from app.models import DayOfWeek
@@ -36,9 +40,59 @@ class AIParseResponse(BaseModel):
     raw_response: str
 
 
-# In-memory rate limiting storage
-# Format: {ip_address: {"count": int, "reset_time": datetime}}
-rate_limit_storage: Dict[str, Dict] = {}
+# Response cache for near-duplicate prompts ("no friday classes" vs "No Friday
+# classes!"). Keyed by a normalized form of the prompt so trivial rewordings hit
+# the cache instead of round-tripping to Claude. LRU with a TTL; sized for the
+# repetitive student prompts this endpoint actually sees.
+# Format: {normalized_prompt: (AIParseResponse, cached_at_monotonic)}
+_parse_cache: "OrderedDict[str, tuple]" = OrderedDict()
+_PARSE_CACHE_MAX_SIZE = 512
+_PARSE_CACHE_TTL_SECONDS = 3600
+
+
+def _normalize_prompt(prompt: str) -> str:
+    """Normalize a prompt for cache lookup: lowercase, strip punctuation, collapse whitespace."""
+    normalized = re.sub(r"[^\w\s:]", "", prompt.lower())
+    return re.sub(r"\s+", " ", normalized).strip()
+
+
+def _cache_get(key: str) -> Optional["AIParseResponse"]:
+    """Return a cached response if present and not expired, refreshing LRU order."""
+    entry = _parse_cache.get(key)
+    if entry is None:
+        return None
+    response, cached_at = entry
+    if time.monotonic() - cached_at > _PARSE_CACHE_TTL_SECONDS:
+        del _parse_cache[key]
+        return None
+    _parse_cache.move_to_end(key)
+    return response
+
+
+def _cache_put(key: str, response: "AIParseResponse") -> None:
+    """Store a response, evicting the least recently used entry when full."""
+    _parse_cache[key] = (response, time.monotonic())
+    _parse_cache.move_to_end(key)
+    while len(_parse_cache) > _PARSE_CACHE_MAX_SIZE:
+        _parse_cache.popitem(last=False)
+
+
+# In-flight Claude calls keyed by (normalized prompt, api key) so bursts of the
+# same prompt share one request instead of each paying for its own
+_inflight: Dict[tuple, "asyncio.Future"] = {}
+
+
+# Anthropic clients pooled per API key so the underlying httpx connection pool
+# (TCP + TLS) is reused across requests instead of being torn down every call
+_clients: Dict[str, AsyncAnthropic] = {}
+
+
+def _get_client(api_key: str) -> AsyncAnthropic:
+    """Return a shared client for this API key, creating it on first use."""
+    client = _clients.get(api_key)
+    if client is None:
+        client = _clients.setdefault(api_key, AsyncAnthropic(api_key=api_key, max_retries=2))
+    return client
 
 
 DAY_MAP = {
@@ -102,6 +156,11 @@ Output: {"courses": [], "unavailable_blocks": [{"day": "Tue", "start_min": 840,
 Return ONLY the JSON object, no explanations."""
 
 
+# Strips a markdown code fence (```json ... ``` or ``` ... ```) the model
+# sometimes wraps around its output, in a single precompiled pass
+_CODE_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.DOTALL)
+
+
 async def parse_natural_language(
     prompt: str, user_api_key: Optional[str] = None
 ) -> AIParseResponse:
@@ -115,21 +174,66 @@ async def parse_natural_language(
     Returns:
         Parsed constraints and confidence score
     """
+    # Serve near-duplicate prompts from cache without touching the API
+    cache_key = _normalize_prompt(prompt)
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        return cached
+
     # Use user's key if provided, otherwise use shared pool key
     api_key = user_api_key or os.getenv("ANTHROPIC_API_KEY")
 
     if not api_key:
         raise ValueError("No Anthropic API key available")
 
-    client = Anthropic(api_key=api_key)
-
-    # Call Claude API
-    message = client.messages.create(
+    # Coalesce bursts: concurrent requests for the same normalized prompt (and
+    # same key) share one in-flight API call instead of fanning out duplicates
+    inflight_key = (cache_key, api_key)
+    task = _inflight.get(inflight_key)
+    if task is None:
+        task = asyncio.ensure_future(_call_claude(prompt, api_key, cache_key))
+        _inflight[inflight_key] = task
+        task.add_done_callback(lambda _: _inflight.pop(inflight_key, None))
+    return await asyncio.shield(task)
+
+
+async def _call_claude(prompt: str, api_key: str, cache_key: str) -> AIParseResponse:
+    """Make the actual Claude API call and parse its JSON output."""
+    client = _get_client(api_key)
+
+    # The JSON output roughly tracks prompt size (each mentioned course/time
+    # becomes a few fields), so cap max_tokens accordingly instead of always
+    # reserving 1024 — shorter caps let the API schedule the request sooner
+    max_tokens = min(1024, 256 + len(prompt))
+
+    # Call Claude API (streamed, so long generations start arriving immediately
+    # instead of waiting on one blocking response)
+    # The system prompt is static, so mark it cacheable: after the first request
+    # Anthropic serves it from the prompt cache (~10% input cost, lower latency).
+    # Only the short user prompt varies per request.
+    async with client.messages.stream(
         model="claude-3-5-haiku-20241022",  # Haiku is fast and cheap
-        max_tokens=1024,
-        system=SYSTEM_PROMPT,
+        max_tokens=max_tokens,
+        system=[
+            {
+                "type": "text",
+                "text": SYSTEM_PROMPT,
+                "cache_control": {"type": "ephemeral"},
+            }
+        ],
         messages=[{"role": "user", "content": prompt}],
-    )
+    ) as stream:
+        message = await stream.get_final_message()
+
+    # Surface cache effectiveness so usage tracking can account for discounted tokens
+    usage = message.usage
+    cache_read = getattr(usage, "cache_read_input_tokens", None)
+    cache_created = getattr(usage, "cache_creation_input_tokens", None)
+    if cache_read is not None or cache_created is not None:
+        print(
+            f"AI parse usage: input={usage.input_tokens} output={usage.output_tokens} "
+            f"cache_read={cache_read} cache_created={cache_created}"
+        )
 
     # Extract response
     response_text = message.content[0].text.strip()
@@ -137,12 +241,12 @@ async def parse_natural_language(
     # Parse JSON response
     try:
         # Try to extract JSON if wrapped in markdown code blocks
-        if "```json" in response_text:
-            response_text = response_text.split("```json")[1].split("```")[0].strip()
-        elif "```" in response_text:
-            response_text = response_text.split("```")[1].split("```")[0].strip()
+        fence_match = _CODE_FENCE_RE.search(response_text)
+        if fence_match:
+            response_text = fence_match.group(1)
 
-        parsed = json.loads(response_text)
+        # orjson parses the small JSON payload ~5-10x faster than stdlib json
+        parsed = orjson.loads(response_text)
 
         # Extract confidence (default to medium if not provided)
         confidence = parsed.pop("confidence", "medium")
@@ -150,11 +254,15 @@ async def parse_natural_language(
         # Create constraints object
         constraints = ParsedConstraints(**parsed)
 
-        return AIParseResponse(
+        result = AIParseResponse(
             constraints=constraints, confidence=confidence, raw_response=response_text
         )
+        # Only successful parses are cached; error responses below fall through
+        # so a transient failure can be retried
+        _cache_put(cache_key, result)
+        return result
 
-    except (json.JSONDecodeError, Exception) as e:
+    except (orjson.JSONDecodeError, Exception) as e:
         # If parsing fails, return empty constraints with low confidence
         return AIParseResponse(
             constraints=ParsedConstraints(),
@@ -40,29 +40,45 @@ def generate_ics(schedule: Schedule, term_start: datetime, term_end: datetime) -
     cal.add("x-wr-calname", "NJIT Schedule")
     cal.add("x-wr-timezone", "America/New_York")
 
+    # Precompute, per weekday, midnight of its first occurrence on or after
+    # term_start; every meeting on that day reuses it instead of redoing the
+    # weekday arithmetic (and datetime.combine) inside the loop
+    term_start_weekday = term_start.weekday()
+    first_occurrence_midnight: Dict[DayOfWeek, datetime] = {}
+    for day, target_iso_weekday in DAY_TO_ISO_WEEKDAY.items():
+        days_ahead = (target_iso_weekday - term_start_weekday) % 7
+        occurrence = term_start + timedelta(days=days_ahead)
+        first_occurrence_midnight[day] = datetime.combine(
+            occurrence.date(), datetime.min.time()
+        )
+
+    # One timestamp for every event in the export
+    dtstamp = datetime.now()
+
+    # Shared recurrence rule: identical for every event in the export
+    rrule = {"freq": "weekly", "until": term_end}
+
     # Generate events for each meeting
     for offering in schedule.offerings:
-        for meeting in offering.meetings:
-            # Find the first occurrence of this day on or after term_start
-            target_iso_weekday = DAY_TO_ISO_WEEKDAY[meeting.day]
-            current_date = term_start
+        # Per-offering pieces built once, not per meeting
+        summary = f"{offering.course_key} - {offering.title}"
+        base_description_parts = [
+            f"Course: {offering.course_key}",
+            f"Section: {offering.section}",
+            f"CRN: {offering.crn}",
+        ]
+        if offering.instructor:
+            base_description_parts.append(f"Instructor: {offering.instructor}")
 
-            # Adjust to the first occurrence of the target day
-            days_ahead = (target_iso_weekday - current_date.weekday()) % 7
-            first_occurrence = current_date + timedelta(days=days_ahead)
+        for meeting in offering.meetings:
+            day_midnight = first_occurrence_midnight[meeting.day]
 
             # Create event
             event = Event()
-            event.add("summary", f"{offering.course_key} - {offering.title}")
+            event.add("summary", summary)
 
             # Build description
-            description_parts = [
-                f"Course: {offering.course_key}",
-                f"Section: {offering.section}",
-                f"CRN: {offering.crn}",
-            ]
-            if offering.instructor:
-                description_parts.append(f"Instructor: {offering.instructor}")
+            description_parts = list(base_description_parts)
             if meeting.location:
                 description_parts.append(f"Location: {meeting.location}")
             if offering.credits:
@@ -74,17 +90,14 @@ def generate_ics(schedule: Schedule, term_start: datetime, term_end: datetime) -
                 event.add("location", meeting.location)
 
             # Calculate start and end datetime for the first occurrence
-            start_time = timedelta(minutes=meeting.start_min)
-            end_time = timedelta(minutes=meeting.end_min)
-
-            dtstart = datetime.combine(first_occurrence.date(), datetime.min.time()) + start_time
-            dtend = datetime.combine(first_occurrence.date(), datetime.min.time()) + end_time
+            dtstart = day_midnight + timedelta(minutes=meeting.start_min)
+            dtend = day_midnight + timedelta(minutes=meeting.end_min)
 
             event.add("dtstart", dtstart)
             event.add("dtend", dtend)
 
             # Add recurrence rule (repeat weekly until term end)
-            event.add("rrule", {"freq": "weekly", "until": term_end})
+            event.add("rrule", rrule)
 
             # Add UID
             event.add(
@@ -93,7 +106,7 @@ def generate_ics(schedule: Schedule, term_start: datetime, term_end: datetime) -
             )
 
             # Add timestamp
-            event.add("dtstamp", datetime.now())
+            event.add("dtstamp", dtstamp)
 
             cal.add_component(event)
 
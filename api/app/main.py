@@ -34,12 +34,17 @@ app = FastAPI(
 )
 
 # CORS middleware for frontend access
-default_origins = [
-    "http://localhost:3000",
-    "http://localhost:3001",
-]
-allowed_origins_env = os.getenv("ALLOWED_ORIGINS")
-if allowed_origins_env:
+
+
+def _compute_allowed_origins() -> List[str]:
+    """Normalize and dedupe allowed origins once at startup (env + local defaults)."""
+    default_origins = [
+        "http://localhost:3000",
+        "http://localhost:3001",
+    ]
+    allowed_origins_env = os.getenv("ALLOWED_ORIGINS")
+    if not allowed_origins_env:
+        return default_origins
     allowed_origins = [
         origin.strip().rstrip("/")
         for origin in allowed_origins_env.split(",")
@@ -47,12 +52,12 @@ if allowed_origins_env:
     ]
     # Always include local development defaults
     allowed_origins.extend(default_origins)
-else:
-    allowed_origins = default_origins
+    return list(dict.fromkeys(allowed_origins))
+
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=list(dict.fromkeys(allowed_origins)),
+    allow_origins=_compute_allowed_origins(),
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -62,6 +67,66 @@ app.add_middleware(
 catalog: List[Offering] = []
 catalog_metadata: Dict = {}
 
+# Derived catalog indexes, rebuilt whenever the catalog changes so the hot
+# /catalog and /catalog/courses paths don't regroup offerings per request
+_offerings_by_course: Dict[str, List[Offering]] = {}  # keyed by lowercased course_key
+_unique_courses: List[Dict] = []
+_courses_with_sections: List[Dict] = []
+
+# Lowercased "course_key title" haystacks, aligned with catalog and
+# _courses_with_sections respectively, so search doesn't call .lower() per request
+_offering_search_text: List[str] = []
+_course_search_text: List[str] = []
+
+
+def _rebuild_catalog_indexes() -> None:
+    """Rebuild the grouped course indexes from the current catalog."""
+    global _offerings_by_course, _unique_courses, _courses_with_sections
+    global _offering_search_text, _course_search_text
+
+    by_course: Dict[str, List[Offering]] = {}
+    unique: Dict[str, Dict] = {}
+    course_map: Dict[str, Dict] = {}
+
+    for offering in catalog:
+        by_course.setdefault(offering.course_key.lower(), []).append(offering)
+
+        if offering.course_key not in unique:
+            unique[offering.course_key] = {
+                "course_key": offering.course_key,
+                "title": offering.title,
+                "section_count": 0,
+            }
+        unique[offering.course_key]["section_count"] += 1
+
+        if offering.course_key not in course_map:
+            course_map[offering.course_key] = {
+                "course_key": offering.course_key,
+                "title": offering.title,
+                "sections": {},  # grouped by CRN to avoid duplicates
+            }
+        crn = offering.crn
+        if crn not in course_map[offering.course_key]["sections"]:
+            course_map[offering.course_key]["sections"][crn] = {
+                "crn": offering.crn,
+                "section": offering.section,
+                "status": offering.status.value,
+                "delivery": offering.delivery.value,
+                "instructor": offering.instructor,
+                "credits": offering.credits,
+            }
+
+    for course_data in course_map.values():
+        course_data["sections"] = list(course_data["sections"].values())
+
+    _offerings_by_course = by_course
+    _unique_courses = list(unique.values())
+    _courses_with_sections = list(course_map.values())
+    _offering_search_text = [f"{o.course_key} {o.title}".lower() for o in catalog]
+    _course_search_text = [
+        f"{c['course_key']} {c['title']}".lower() for c in _courses_with_sections
+    ]
+
 # Shared schedules: id → serialized Schedule dict
 _shared_schedules: Dict[str, dict] = {}
 
@@ -70,21 +135,23 @@ _prereqs_cache: Dict[str, Optional[str]] = {}
 
 # Solve endpoint rate limiting (separate from AI rate limiter)
 # Note: request.client.host is the proxy IP when behind a reverse proxy (e.g. Render).
-_solve_rate_limit: Dict[str, List[float]] = {}
+# Bucketed fixed-window counters on the monotonic clock: O(1) per check with no
+# per-request timestamp lists to rebuild, and immune to wall-clock jumps.
+_solve_rate_limit: Dict[str, List[int]] = {}  # ip -> [window_index, count]
 SOLVE_RATE_LIMIT = 30  # requests per minute per IP
 SOLVE_RATE_WINDOW = 60  # seconds
 
 
 def _check_solve_rate_limit(ip: str) -> bool:
     """Returns True if the request should be allowed."""
-    now = _time.time()
-    window_start = now - SOLVE_RATE_WINDOW
-    timestamps = [t for t in _solve_rate_limit.get(ip, []) if t > window_start]
-    if len(timestamps) >= SOLVE_RATE_LIMIT:
-        _solve_rate_limit[ip] = timestamps
+    window = int(_time.monotonic() // SOLVE_RATE_WINDOW)
+    bucket = _solve_rate_limit.get(ip)
+    if bucket is None or bucket[0] != window:
+        _solve_rate_limit[ip] = [window, 1]
+        return True
+    if bucket[1] >= SOLVE_RATE_LIMIT:
         return False
-    timestamps.append(now)
-    _solve_rate_limit[ip] = timestamps
+    bucket[1] += 1
     return True
 
 
@@ -130,6 +197,7 @@ async def startup_event():
     """Load existing CSVs from courseschedules directory on startup."""
     global catalog, catalog_metadata
     catalog, catalog_metadata = _load_catalog_from_disk()
+    _rebuild_catalog_indexes()
 
 
 @app.get("/")
@@ -157,6 +225,7 @@ async def reload_catalog(x_reload_secret: Optional[str] = Header(default=None)):
         raise HTTPException(status_code=401, detail="Invalid or missing X-Reload-Secret header")
 
     catalog, catalog_metadata = _load_catalog_from_disk()
+    _rebuild_catalog_indexes()
     return {
         "status": "reloaded",
         "offering_count": len(catalog),
@@ -181,28 +250,26 @@ async def ingest_csv(file: UploadFile = File(...)):
         raise HTTPException(status_code=400, detail="File must be a CSV")
 
     try:
-        # Save temporarily
+        # Stream to a temp file in chunks so large uploads never sit fully in memory
         temp_path = f"/tmp/{file.filename}"
-        contents = await file.read()
         with open(temp_path, "wb") as f:
-            f.write(contents)
+            while chunk := await file.read(1024 * 1024):
+                f.write(chunk)
 
         # Normalize
         new_offerings = normalize_csv(temp_path)
 
-        # Add to catalog (with deduplication by CRN)
-        existing_crns = {o.crn for o in catalog}
-        added = 0
-        for offering in new_offerings:
-            if offering.crn not in existing_crns:
-                catalog.append(offering)
-                existing_crns.add(offering.crn)
-                added += 1
+        # Add to catalog (with deduplication by CRN, via set difference)
+        new_by_crn = {o.crn: o for o in new_offerings}
+        fresh_crns = new_by_crn.keys() - {o.crn for o in catalog}
+        catalog.extend(o for crn, o in new_by_crn.items() if crn in fresh_crns)
+        added = len(fresh_crns)
 
         catalog_metadata = {
             "updated_at": datetime.now().isoformat(),
             "offering_count": len(catalog),
         }
+        _rebuild_catalog_indexes()
 
         # Clean up
         os.remove(temp_path)
@@ -238,39 +305,35 @@ async def get_catalog(
     Returns:
         List of offerings and metadata
     """
-    filtered = catalog
-
     if course_key:
-        filtered = [o for o in filtered if o.course_key.lower() == course_key.lower()]
-
-    if search:
+        filtered = _offerings_by_course.get(course_key.lower(), [])
+        if search:
+            search_lower = search.lower()
+            filtered = [
+                o
+                for o in filtered
+                if search_lower in o.course_key.lower() or search_lower in o.title.lower()
+            ]
+    elif search:
+        # Full-catalog search uses the precomputed lowercase haystacks
         search_lower = search.lower()
         filtered = [
             o
-            for o in filtered
-            if search_lower in o.course_key.lower() or search_lower in o.title.lower()
+            for o, haystack in zip(catalog, _offering_search_text)
+            if search_lower in haystack
         ]
+    else:
+        filtered = catalog
 
     total = len(filtered)
     paginated = filtered[offset : offset + limit]
 
-    # Get unique course keys for frontend
-    unique_courses = {}
-    for offering in catalog:
-        if offering.course_key not in unique_courses:
-            unique_courses[offering.course_key] = {
-                "course_key": offering.course_key,
-                "title": offering.title,
-                "section_count": 0,
-            }
-        unique_courses[offering.course_key]["section_count"] += 1
-
     return {
         "offerings": paginated,
         "total": total,
         "limit": limit,
         "offset": offset,
-        "unique_courses": list(unique_courses.values()),
+        "unique_courses": _unique_courses,
         "metadata": catalog_metadata,
     }
 
@@ -286,40 +349,14 @@ async def get_courses(search: Optional[str] = None):
     Returns:
         List of courses
     """
-    course_map = {}
-
-    for offering in catalog:
-        if offering.course_key not in course_map:
-            course_map[offering.course_key] = {
-                "course_key": offering.course_key,
-                "title": offering.title,
-                "sections": {},  # Changed to dict to group by CRN
-            }
-
-        # Group sections by CRN to avoid duplicates
-        crn = offering.crn
-        if crn not in course_map[offering.course_key]["sections"]:
-            course_map[offering.course_key]["sections"][crn] = {
-                "crn": offering.crn,
-                "section": offering.section,
-                "status": offering.status.value,
-                "delivery": offering.delivery.value,
-                "instructor": offering.instructor,
-                "credits": offering.credits,
-            }
-
-    # Convert sections dict back to list
-    courses = []
-    for course_data in course_map.values():
-        course_data["sections"] = list(course_data["sections"].values())
-        courses.append(course_data)
+    courses = _courses_with_sections
 
     if search:
         search_lower = search.lower()
         courses = [
             c
-            for c in courses
-            if search_lower in c["course_key"].lower() or search_lower in c["title"].lower()
+            for c, haystack in zip(_courses_with_sections, _course_search_text)
+            if search_lower in haystack
         ]
 
     return {"courses": courses, "total": len(courses)}
@@ -358,13 +395,11 @@ async def solve(request_body: SolveRequest, request: Request):
     # Solve
     schedules = solve_schedules(catalog, request_body)
 
-    # Count unique courses in catalog
-    unique_courses = len(set(o.course_key for o in catalog))
-
     return SolveResponse(
         schedules=schedules,
         count=len(schedules),
-        catalog_course_count=unique_courses,
+        # Unique course count comes from the prebuilt index, not a per-call scan
+        catalog_course_count=len(_unique_courses),
         catalog_section_count=len(catalog),
     )
 
@@ -500,10 +535,36 @@ async def export_csv(schedule: Schedule):
     import csv
     import io
 
+    def _rows():
+        """Yield one CSV row per offering."""
+        for offering in schedule.offerings:
+            # Format days and times
+            if offering.meetings:
+                days_str = "".join(sorted(set(m.day.value[0] for m in offering.meetings)))
+                first_meeting = offering.meetings[0]
+                times_str = f"{_minutes_to_ampm(first_meeting.start_min)} - {_minutes_to_ampm(first_meeting.end_min)}"
+                location = first_meeting.location or ""
+            else:
+                days_str = "TBA"
+                times_str = "TBA"
+                location = ""
+
+            yield (
+                offering.course_key,
+                offering.title,
+                offering.crn,
+                offering.section,
+                days_str,
+                times_str,
+                location,
+                offering.instructor or "",
+                offering.delivery.value,
+                offering.credits or "",
+                offering.status.value,
+            )
+
     output = io.StringIO()
     writer = csv.writer(output)
-
-    # Header
     writer.writerow(
         [
             "Course",
@@ -519,35 +580,9 @@ async def export_csv(schedule: Schedule):
             "Status",
         ]
     )
-
-    # Rows
-    for offering in schedule.offerings:
-        # Format days and times
-        if offering.meetings:
-            days_str = "".join(sorted(set(m.day.value[0] for m in offering.meetings)))
-            first_meeting = offering.meetings[0]
-            times_str = f"{_minutes_to_ampm(first_meeting.start_min)} - {_minutes_to_ampm(first_meeting.end_min)}"
-            location = first_meeting.location or ""
-        else:
-            days_str = "TBA"
-            times_str = "TBA"
-            location = ""
-
-        writer.writerow(
-            [
-                offering.course_key,
-                offering.title,
-                offering.crn,
-                offering.section,
-                days_str,
-                times_str,
-                location,
-                offering.instructor or "",
-                offering.delivery.value,
-                offering.credits or "",
-                offering.status.value,
-            ]
-        )
+    # Single writerows call over the generator avoids a Python-level
+    # writer.writerow call per offering
+    writer.writerows(_rows())
 
     csv_content = output.getvalue()
     output.close()
@@ -1,6 +1,7 @@
 """Data models for NJIT Schedule Pro."""
 
 from enum import Enum
+from functools import cached_property
 from typing import List, Optional
 
 from pydantic import BaseModel, Field
@@ -18,6 +19,13 @@ class DayOfWeek(str, Enum):
     SUNDAY = "Sun"
 
 
+# Day offsets into the packed week bitmap (one bit per minute, 1440 per day)
+_DAY_BIT_OFFSET = {day: i * 1440 for i, day in enumerate(DayOfWeek)}
+
+# Ordinal day index, for the 7-bit day masks
+_DAY_INDEX = {day: i for i, day in enumerate(DayOfWeek)}
+
+
 class Status(str, Enum):
     """Course section status."""
 
@@ -49,6 +57,17 @@ class Meeting(BaseModel):
             return False
         return not (self.end_min <= other.start_min or self.start_min >= other.end_min)
 
+    @cached_property
+    def time_bitmap(self) -> int:
+        """
+        Week bitmap with one bit set per occupied minute, offset by day.
+        Python ints are arbitrary-width, so this stays exact at minute resolution.
+        """
+        if self.end_min <= self.start_min:
+            return 0
+        day_mask = (1 << (self.end_min - self.start_min)) - 1
+        return day_mask << (self.start_min + _DAY_BIT_OFFSET[self.day])
+
     def conflicts_with_unavailable(
         self, unavailable_start: int, unavailable_end: int
     ) -> tuple[bool, int]:
@@ -97,13 +116,50 @@ class Offering(BaseModel):
         """Check if this is an honors section (section starts with H)."""
         return self.section.upper().startswith('H')
 
+    @cached_property
+    def time_bitmap(self) -> int:
+        """
+        Union of this offering's meeting bitmaps (one bit per occupied minute).
+        Computed lazily and cached, so it must only be read after normalization
+        has finished merging meetings into the offering.
+        """
+        bitmap = 0
+        for meeting in self.meetings:
+            bitmap |= meeting.time_bitmap
+        return bitmap
+
+    @cached_property
+    def day_mask(self) -> int:
+        """7-bit mask of the weekdays this offering meets on."""
+        mask = 0
+        for meeting in self.meetings:
+            mask |= 1 << _DAY_INDEX[meeting.day]
+        return mask
+
     def overlaps_with(self, other: "Offering") -> bool:
         """Check if any meeting in this offering overlaps with another offering."""
-        for m1 in self.meetings:
-            for m2 in other.meetings:
-                if m1.overlaps(m2):
-                    return True
-        return False
+        # Cheap 7-bit AND rejects the common MWF-vs-TR case before touching
+        # the (much wider) minute bitmaps
+        if not (self.day_mask & other.day_mask):
+            return False
+        return (self.time_bitmap & other.time_bitmap) != 0
+
+    @cached_property
+    def crn_int(self) -> int:
+        """Numeric CRN for scoring tie-breaks; hash fallback for odd CRNs."""
+        return int(self.crn) if self.crn.isdigit() else hash(self.crn)
+
+    @cached_property
+    def meeting_sig(self) -> tuple:
+        """
+        Canonical (day, start, end) tuple over meetings, sorted for order
+        independence. Cached like time_bitmap: only read it after
+        normalization has finished merging meetings.
+        """
+        meetings = self.meetings
+        if len(meetings) > 1:
+            meetings = sorted(meetings, key=lambda m: (m.day.value, m.start_min))
+        return tuple((m.day, m.start_min, m.end_min) for m in meetings)
 
 
 class AvailabilityBlock(BaseModel):
@@ -159,15 +215,20 @@ class Schedule(BaseModel):
         ..., description="Lower is better; primary: gaps, instructor prefs, etc."
     )
 
+    @cached_property
+    def crn_fingerprint(self) -> frozenset:
+        """Frozenset of CRNs, computed once and reused by __hash__/__eq__."""
+        return frozenset(o.crn for o in self.offerings)
+
     def __hash__(self):
-        """Hash by sorted CRNs for deduplication."""
-        return hash(tuple(sorted(o.crn for o in self.offerings)))
+        """Hash by the CRN fingerprint for deduplication."""
+        return hash(self.crn_fingerprint)
 
     def __eq__(self, other):
         """Equal if same set of CRNs."""
         if not isinstance(other, Schedule):
             return False
-        return set(o.crn for o in self.offerings) == set(o.crn for o in other.offerings)
+        return self.crn_fingerprint == other.crn_fingerprint
 
 
 class SolveResponse(BaseModel):
@@ -1,12 +1,24 @@
 """CSV normalization for NJIT course schedules."""
 
+import os
 import re
+import sys
+from functools import lru_cache
 from typing import Dict, List, Optional
 
-import pandas as pd
-
 from app.models import DayOfWeek, DeliveryMode, Meeting, Offering, Status
 
+# pandas is by far the most expensive import in the project (~0.5s cold) and is
+# only needed when CSVs are actually parsed, so it is imported inside the
+# functions that use it rather than at module load. After the first import the
+# cost is a sys.modules dict hit.
+
+
+# Precompiled module-level patterns (compiling per call shows up across
+# thousands of rows even with re's internal cache)
+_TIME_RANGE_SPLIT_RE = re.compile(r"\s*-\s*|\s+to\s+")
+_COURSE_KEY_RE = re.compile(r"([A-Z]+)\s*(\d+)([A-Z]*)")
+
 
 # Days parsing map
 DAY_MAP = {
@@ -19,6 +31,12 @@ DAY_MAP = {
     "U": DayOfWeek.SUNDAY,
 }
 
+# 256-entry table indexed by byte value: parse_days does a plain array index
+# per character instead of hashing into DAY_MAP
+_DAY_LUT: List[Optional[DayOfWeek]] = [None] * 256
+for _char, _day in DAY_MAP.items():
+    _DAY_LUT[ord(_char)] = _day
+
 
 def parse_days(days_str: str) -> List[DayOfWeek]:
     """
@@ -33,23 +51,18 @@ def parse_days(days_str: str) -> List[DayOfWeek]:
     if not days_str or days_str.strip() == "" or days_str.upper() == "TBA":
         return []
 
-    days_str = days_str.strip().upper()
-    result = []
-
-    # Handle special case: Thursday is 'R' not 'T'
-    i = 0
-    while i < len(days_str):
-        char = days_str[i]
-        if char in DAY_MAP:
-            result.append(DAY_MAP[char])
-        i += 1
-
-    return result
+    # Byte-indexed table lookup per character (Thursday is 'R', not 'T');
+    # unknown characters map to None and are skipped
+    lut = _DAY_LUT
+    return [day for byte in days_str.strip().upper().encode() if (day := lut[byte]) is not None]
 
 
+@lru_cache(maxsize=2048)
 def parse_time(time_str: str) -> Optional[int]:
     """
     Parse a time string like '8:30 AM' or '11:20 PM' into minutes from midnight.
+    The catalog only uses a small set of class times, so results are memoized
+    and repeat calls are a table lookup.
 
     Args:
         time_str: Time string in format 'H:MM AM/PM' or 'HH:MM AM/PM'
@@ -62,28 +75,36 @@ def parse_time(time_str: str) -> Optional[int]:
 
     time_str = time_str.strip()
 
-    # Match patterns like "8:30 AM", "11:20 PM", "10:00 am"
-    match = re.match(r"(\d{1,2}):(\d{2})\s*(AM|PM|am|pm)", time_str)
-    if not match:
+    # Parse "8:30 AM" / "11:20 PM" / "10:00 am" with plain slicing and int();
+    # the format is rigid enough that regex machinery is pure overhead here
+    colon = time_str.find(":")
+    if colon <= 0:
         return None
 
-    hour = int(match.group(1))
-    minute = int(match.group(2))
-    period = match.group(3).upper()
+    try:
+        hour = int(time_str[:colon])
+        minute = int(time_str[colon + 1 : colon + 3])
+    except ValueError:
+        return None
 
-    # Convert to 24-hour format
-    if period == "PM" and hour != 12:
-        hour += 12
-    elif period == "AM" and hour == 12:
-        hour = 0
+    period = time_str[colon + 3 :].strip().upper()
+    if period == "PM":
+        # hour % 12 keeps 12 PM as noon; + 12 shifts the rest to 24-hour
+        hour = hour % 12 + 12
+    elif period == "AM":
+        hour = hour % 12
+    else:
+        return None
 
     # Convert to minutes from midnight
     return hour * 60 + minute
 
 
+@lru_cache(maxsize=2048)
 def parse_times(times_str: str) -> tuple[Optional[int], Optional[int]]:
     """
     Parse a times string like '8:30 AM - 9:50 AM' into (start_min, end_min).
+    Memoized like parse_time: distinct time ranges number in the hundreds.
 
     Args:
         times_str: Time range string
@@ -95,7 +116,7 @@ def parse_times(times_str: str) -> tuple[Optional[int], Optional[int]]:
         return None, None
 
     # Split on '-' or 'to'
-    parts = re.split(r"\s*-\s*|\s+to\s+", times_str.strip(), maxsplit=1)
+    parts = _TIME_RANGE_SPLIT_RE.split(times_str.strip(), maxsplit=1)
     if len(parts) != 2:
         return None, None
 
@@ -105,18 +126,32 @@ def parse_times(times_str: str) -> tuple[Optional[int], Optional[int]]:
     return start, end
 
 
+# Memoized results for the status/delivery vocabularies. The catalog only ever
+# contains a handful of distinct values ("Open", "Face-to-Face", ...), so after
+# the first few rows every call is a single dict hit instead of substring scans.
+_status_memo: Dict[str, Status] = {}
+_delivery_memo: Dict[tuple, DeliveryMode] = {}
+
+
 def normalize_status(status_str: str) -> Status:
     """Normalize status field to Status enum."""
     if not status_str:
         return Status.OPEN
 
-    status_str = status_str.strip().lower()
-    if "closed" in status_str:
-        return Status.CLOSED
-    elif "wait" in status_str:
-        return Status.WAITLIST
+    memoized = _status_memo.get(status_str)
+    if memoized is not None:
+        return memoized
+
+    lowered = status_str.strip().lower()
+    if "closed" in lowered:
+        status = Status.CLOSED
+    elif "wait" in lowered:
+        status = Status.WAITLIST
     else:
-        return Status.OPEN
+        status = Status.OPEN
+
+    _status_memo[status_str] = status
+    return status
 
 
 def normalize_delivery(delivery_str: str, location: str = "") -> DeliveryMode:
@@ -130,29 +165,57 @@ def normalize_delivery(delivery_str: str, location: str = "") -> DeliveryMode:
     Returns:
         DeliveryMode enum
     """
+    memo_key = (delivery_str, location if not delivery_str else "")
+    memoized = _delivery_memo.get(memo_key)
+    if memoized is not None:
+        return memoized
+
     if not delivery_str:
         # Try to infer from location
         if location and ("online" in location.lower() or "web" in location.lower()):
-            return DeliveryMode.ONLINE
-        return DeliveryMode.IN_PERSON
-
-    delivery_str = delivery_str.strip().lower()
-
-    if "online" in delivery_str or "web" in delivery_str or "distance" in delivery_str:
-        return DeliveryMode.ONLINE
-    elif "hybrid" in delivery_str or "blended" in delivery_str:
-        return DeliveryMode.HYBRID
-    elif "async" in delivery_str or "asynchronous" in delivery_str:
-        return DeliveryMode.ASYNC
-    elif "face-to-face" in delivery_str or "in-person" in delivery_str or "in person" in delivery_str:
-        return DeliveryMode.IN_PERSON
+            delivery = DeliveryMode.ONLINE
+        else:
+            delivery = DeliveryMode.IN_PERSON
+        _delivery_memo[memo_key] = delivery
+        return delivery
+
+    lowered = delivery_str.strip().lower()
+
+    if "online" in lowered or "web" in lowered or "distance" in lowered:
+        delivery = DeliveryMode.ONLINE
+    elif "hybrid" in lowered or "blended" in lowered:
+        delivery = DeliveryMode.HYBRID
+    elif "async" in lowered or "asynchronous" in lowered:
+        delivery = DeliveryMode.ASYNC
     else:
-        return DeliveryMode.IN_PERSON
+        delivery = DeliveryMode.IN_PERSON
 
+    _delivery_memo[memo_key] = delivery
+    return delivery
 
+
+# Warm the memos with the vocabularies the scraper actually emits, so even the
+# first occurrence of each value resolves as a dict hit; the substring chains
+# above stay as the fallback for variants
+for _value in ("Open", "Closed", "Waitlist", "Cancelled"):
+    normalize_status(_value)
+for _value in (
+    "Face-to-Face",
+    "Hybrid",
+    "Converged Learning",
+    "Online Newark",
+    "Online Virtual",
+):
+    normalize_delivery(_value)
+del _value
+
+
+@lru_cache(maxsize=4096)
 def extract_course_key(course_str: str) -> str:
     """
     Extract course key (e.g., 'CS 100', 'PHYS 111A') from course string.
+    Pure with only a few hundred distinct inputs per catalog, so results are
+    memoized; repeat rows cost a cache hit instead of a regex match.
 
     Args:
         course_str: Course identifier from CSV
@@ -165,7 +228,7 @@ def extract_course_key(course_str: str) -> str:
 
     # Extract subject code, catalog number, and optional suffix (like A for labs)
     # Patterns: "CS100", "CS 100", "ACCT115", "PHYS111A", etc.
-    match = re.match(r"([A-Z]+)\s*(\d+)([A-Z]*)", course_str.strip().upper())
+    match = _COURSE_KEY_RE.match(course_str.strip().upper())
     if match:
         subject = match.group(1)
         catalog = match.group(2)
@@ -175,42 +238,60 @@ def extract_course_key(course_str: str) -> str:
     return course_str.strip().upper()
 
 
-def normalize_csv_row(row: pd.Series) -> Optional[Offering]:
+def normalize_csv_row(
+    row, numeric: Optional[tuple] = None, parsed: Optional[tuple] = None
+) -> Optional[Offering]:
     """
     Normalize a single CSV row into an Offering.
 
     Args:
-        row: pandas Series representing one CSV row
+        row: Mapping of column name to value (plain dict or pandas Series)
+        numeric: Optional pre-coerced (capacity, enrolled, credits) triple from
+            a vectorized column pass; when omitted the values are parsed from
+            the row itself
+        parsed: Optional pre-parsed (course_key, days, (start, end)) triple
+            from the column-level unique-value maps; any None element falls
+            back to parsing the row
 
     Returns:
         Offering object, or None if row is invalid/unparseable
     """
+    if parsed is None:
+        parsed = (None, None, None)
+
     try:
         # Extract basic fields
         crn = str(row.get("CRN", "")).strip()
         if not crn:
             return None
 
-        course_raw = str(row.get("Course", "")).strip()
-        course_key = extract_course_key(course_raw)
+        course_key = parsed[0]
+        if course_key is None:
+            course_key = extract_course_key(str(row.get("Course", "")).strip())
         if not course_key:
             return None
 
-        title = str(row.get("Title", "")).strip()
-        section = str(row.get("Section", "")).strip()
-        term = str(row.get("Term", "")).strip()
+        # Intern the short, heavily duplicated strings (every section of a
+        # course shares its title/term; locations and instructors repeat
+        # across the catalog) so duplicates share one heap object and later
+        # dict/equality work hits pointer comparison first
+        title = sys.intern(str(row.get("Title", "")).strip())
+        section = sys.intern(str(row.get("Section", "")).strip())
+        term = sys.intern(str(row.get("Term", "")).strip())
 
         # Parse days and times
-        days_str = str(row.get("Days", "")).strip()
-        times_str = str(row.get("Times", "")).strip()
-
-        days = parse_days(days_str)
-        start_min, end_min = parse_times(times_str)
+        days = parsed[1]
+        if days is None:
+            days = parse_days(str(row.get("Days", "")).strip())
+        times = parsed[2]
+        if times is None:
+            times = parse_times(str(row.get("Times", "")).strip())
+        start_min, end_min = times
 
         # Build meetings
         meetings: List[Meeting] = []
         if days and start_min is not None and end_min is not None:
-            location = str(row.get("Location", "")).strip()
+            location = sys.intern(str(row.get("Location", "")).strip())
             for day in days:
                 meetings.append(
                     Meeting(
@@ -227,20 +308,27 @@ def normalize_csv_row(row: pd.Series) -> Optional[Offering]:
         location_str = str(row.get("Location", ""))
         delivery = normalize_delivery(delivery_str, location_str)
 
-        max_cap = row.get("Max")
-        capacity = int(max_cap) if pd.notna(max_cap) and str(max_cap).strip() else None
+        if numeric is not None:
+            capacity, enrolled, credits = numeric
+        else:
+            import pandas as pd
+
+            max_cap = row.get("Max")
+            capacity = int(max_cap) if pd.notna(max_cap) and str(max_cap).strip() else None
 
-        now_enrolled = row.get("Now")
-        enrolled = int(now_enrolled) if pd.notna(now_enrolled) and str(now_enrolled).strip() else None
+            now_enrolled = row.get("Now")
+            enrolled = int(now_enrolled) if pd.notna(now_enrolled) and str(now_enrolled).strip() else None
 
-        credits_val = row.get("Credits")
-        credits = float(credits_val) if pd.notna(credits_val) and str(credits_val).strip() else None
+            credits_val = row.get("Credits")
+            credits = float(credits_val) if pd.notna(credits_val) and str(credits_val).strip() else None
 
         def _clean(val) -> str | None:
             s = str(val).strip()
             return None if not s or s.lower() == "nan" else s
 
         instructor = _clean(row.get("Instructor", ""))
+        if instructor is not None:
+            instructor = sys.intern(instructor)
         info = _clean(row.get("Info", ""))
         comments = _clean(row.get("Comments", ""))
 
@@ -267,6 +355,126 @@ def normalize_csv_row(row: pd.Series) -> Optional[Offering]:
         return None
 
 
+# Columns normalize_csv_row reads; anything else in a CSV is dropped at parse
+_CSV_COLUMNS = frozenset(
+    [
+        "Term",
+        "Course",
+        "Title",
+        "Section",
+        "CRN",
+        "Days",
+        "Times",
+        "Location",
+        "Status",
+        "Max",
+        "Now",
+        "Instructor",
+        "Delivery Mode",
+        "Credits",
+        "Info",
+        "Comments",
+    ]
+)
+
+
+# Parsed-row cache: raw row values -> pristine Offering. Scrape runs leave
+# overlapping per-subject files, so identical rows recur across CSVs; a hit
+# skips the whole parse. Entries are copied on the way in and out because
+# merge_offerings_by_crn mutates meeting lists.
+_row_cache: Dict[tuple, Offering] = {}
+_ROW_CACHE_MAX = 50000
+
+
+def _copy_offering(offering: Offering) -> Offering:
+    """Shallow copy with its own meetings list (Meeting objects are shared)."""
+    return offering.model_copy(update={"meetings": list(offering.meetings)})
+
+
+def _numeric_column(df, name: str, cast) -> Optional[list]:
+    """
+    Coerce a whole column to numbers in one vectorized pass.
+
+    Returns a list aligned with the dataframe rows, with None where the cell
+    was blank/unparseable, or None if the column is absent entirely.
+    """
+    import pandas as pd
+
+    if name not in df.columns:
+        return None
+    values = pd.to_numeric(df[name], errors="coerce").to_numpy()
+    # NaN != NaN flags blanks without a per-value pd.isna call
+    return [None if v != v else cast(v) for v in values]
+
+
+def _unique_parse_map(df, name: str, parse) -> Optional[dict]:
+    """
+    Parse each distinct raw value of a column exactly once.
+
+    Catalogs repeat the same few hundred course/days/times strings across
+    thousands of rows, so the per-row cost collapses to a dict lookup. Returns
+    None if the column is absent.
+    """
+    if name not in df.columns:
+        return None
+    return {value: parse(str(value).strip()) for value in df[name].unique()}
+
+
+def normalize_dataframe(df) -> List[Offering]:
+    """
+    Normalize a parsed schedule DataFrame into Offerings.
+
+    Column-level work happens once per column — numeric coercion in a
+    vectorized pass, string parsing over unique values — and the per-row loop
+    is left with dict lookups plus Offering construction.
+
+    Args:
+        df: DataFrame with the raw schedule columns (as read by normalize_csv)
+
+    Returns:
+        List of Offering objects
+    """
+    # Numeric columns coerced in one C loop each rather than per-row int/float
+    capacities = _numeric_column(df, "Max", int)
+    enrollments = _numeric_column(df, "Now", int)
+    credit_hours = _numeric_column(df, "Credits", float)
+
+    # Parse-heavy string columns resolved once per distinct value
+    course_keys = _unique_parse_map(df, "Course", extract_course_key)
+    day_lists = _unique_parse_map(df, "Days", parse_days)
+    time_ranges = _unique_parse_map(df, "Times", parse_times)
+
+    # to_dict("records") materializes all rows as plain dicts in one C-level
+    # pass, roughly 10x faster than constructing a Series per row via iterrows
+    offerings = []
+    for idx, row in enumerate(df.to_dict("records")):
+        cache_key = tuple(str(v) for v in row.values())
+        cached = _row_cache.get(cache_key)
+        if cached is not None:
+            offerings.append(_copy_offering(cached))
+            continue
+
+        offering = normalize_csv_row(
+            row,
+            numeric=(
+                capacities[idx] if capacities is not None else None,
+                enrollments[idx] if enrollments is not None else None,
+                credit_hours[idx] if credit_hours is not None else None,
+            ),
+            parsed=(
+                course_keys.get(row.get("Course")) if course_keys is not None else None,
+                day_lists.get(row.get("Days")) if day_lists is not None else None,
+                time_ranges.get(row.get("Times")) if time_ranges is not None else None,
+            ),
+        )
+        if offering:
+            if len(_row_cache) < _ROW_CACHE_MAX:
+                _row_cache[cache_key] = _copy_offering(offering)
+            offerings.append(offering)
+
+    return offerings
+
+
 def normalize_csv(file_path: str) -> List[Offering]:
     """
     Read and normalize a single CSV file.
@@ -277,19 +485,26 @@ def normalize_csv(file_path: str) -> List[Offering]:
     Returns:
         List of Offering objects
     """
+    import pandas as pd
+
     try:
-        df = pd.read_csv(file_path)
+        # Only pull the columns the row parser reads, as plain strings: skips
+        # dtype inference and parsing of unused columns (e.g. long Info URLs).
+        # na_filter=False skips the NA-sentinel scan and leaves blanks as ""
+        # (which also lets rows with a blank CRN/Course be dropped cleanly
+        # instead of surfacing as the string "nan")
+        df = pd.read_csv(
+            file_path,
+            usecols=lambda col: col in _CSV_COLUMNS,
+            dtype=str,
+            engine="c",
+            na_filter=False,
+        )
     except Exception as e:
         print(f"Error reading CSV {file_path}: {e}")
         return []
 
-    offerings = []
-    for _, row in df.iterrows():
-        offering = normalize_csv_row(row)
-        if offering:
-            offerings.append(offering)
-
-    return offerings
+    return normalize_dataframe(df)
 
 
 def deduplicate_offerings(offerings: List[Offering]) -> List[Offering]:
@@ -306,11 +521,9 @@ def deduplicate_offerings(offerings: List[Offering]) -> List[Offering]:
     unique = []
 
     for offering in offerings:
-        # Create signature: CRN + meeting days/times
-        meeting_sig = tuple(
-            (m.day, m.start_min, m.end_min) for m in sorted(offering.meetings, key=lambda x: (x.day.value, x.start_min))
-        )
-        sig = (offering.crn, meeting_sig)
+        # Signature: CRN + the offering's cached canonical meeting tuple
+        # (single-meeting offerings skip the sort entirely)
+        sig = (offering.crn, offering.meeting_sig)
 
         if sig not in seen:
             seen.add(sig)
@@ -333,6 +546,9 @@ def merge_offerings_by_crn(offerings: List[Offering]) -> List[Offering]:
         List with offerings merged by CRN
     """
     crn_map: Dict[str, Offering] = {}
+    # Per-CRN set of (day, start, end) signatures so the duplicate check is a
+    # set lookup instead of a scan over the already-merged meetings
+    seen_meetings: Dict[str, set] = {}
 
     for offering in offerings:
         crn = offering.crn
@@ -340,30 +556,34 @@ def merge_offerings_by_crn(offerings: List[Offering]) -> List[Offering]:
         if crn not in crn_map:
             # First occurrence of this CRN
             crn_map[crn] = offering
+            seen_meetings[crn] = {
+                (m.day, m.start_min, m.end_min) for m in offering.meetings
+            }
         else:
             # Merge meetings from this offering into the existing one
             existing = crn_map[crn]
+            signatures = seen_meetings[crn]
 
-            # Add meetings that aren't already present
             for meeting in offering.meetings:
-                # Check if this exact meeting already exists
-                meeting_exists = any(
-                    m.day == meeting.day and
-                    m.start_min == meeting.start_min and
-                    m.end_min == meeting.end_min
-                    for m in existing.meetings
-                )
-
-                if not meeting_exists:
+                sig = (meeting.day, meeting.start_min, meeting.end_min)
+                if sig not in signatures:
+                    signatures.add(sig)
                     existing.meetings.append(meeting)
 
     return list(crn_map.values())
 
 
+# Below this many files, process startup cost outweighs the parallel parse win
+_PARALLEL_CSV_THRESHOLD = 8
+
+
 def normalize_multiple_csvs(file_paths: List[str]) -> List[Offering]:
     """
     Normalize multiple CSV files and merge into a single catalog.
 
+    Large batches (the per-subject files loaded at startup) are parsed in a
+    process pool; small batches stay sequential to avoid pool startup cost.
+
     Args:
         file_paths: List of CSV file paths
 
@@ -372,9 +592,19 @@ def normalize_multiple_csvs(file_paths: List[str]) -> List[Offering]:
     """
     all_offerings = []
 
-    for path in file_paths:
-        offerings = normalize_csv(path)
-        all_offerings.extend(offerings)
+    if len(file_paths) >= _PARALLEL_CSV_THRESHOLD:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor() as executor:
+            # chunksize batches several files per IPC round-trip; per-subject
+            # CSVs are small, so one-file tasks would be dominated by pickling
+            chunksize = max(1, len(file_paths) // ((os.cpu_count() or 1) * 4))
+            for offerings in executor.map(normalize_csv, file_paths, chunksize=chunksize):
+                all_offerings.extend(offerings)
+    else:
+        for path in file_paths:
+            offerings = normalize_csv(path)
+            all_offerings.extend(offerings)
 
     # Merge offerings with same CRN (sections with multiple meeting times)
     merged = merge_offerings_by_crn(all_offerings)
@@ -1,13 +1,10 @@
 """Rate limiting for AI features."""
 
+import time
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Dict, Optional
 
-# In-memory storage for rate limiting
-# In production, this should be Redis or a database
-# Format: {ip_address: {"daily_count": int, "total_count": int, "last_reset": datetime}}
-usage_storage: Dict[str, Dict] = {}
-
 # Rate limits based on $10 budget (~7,000 requests with Haiku)
 # Conservative limits to prevent abuse
 DAILY_LIMIT_PER_IP = 5  # 5 requests per day per IP
@@ -15,13 +12,49 @@ TOTAL_LIMIT_PER_IP = 15  # 15 total requests per IP (lifetime)
 HOURLY_LIMIT_PER_IP = 3  # 3 requests per hour (prevents rapid abuse)
 GLOBAL_TOTAL_LIMIT = 7000  # Total requests across all users
 
+_DAY_SECONDS = 24 * 3600
+_HOUR_SECONDS = 3600
+
+
+@dataclass
+class IpUsage:
+    """Per-IP usage counters with monotonic reset deadlines."""
+
+    daily_count: int = 0
+    hourly_count: int = 0
+    total_count: int = 0
+    # Monotonic deadlines (time.monotonic() values) — immune to wall-clock jumps
+    daily_reset: float = field(default_factory=lambda: time.monotonic() + _DAY_SECONDS)
+    hourly_reset: float = field(default_factory=lambda: time.monotonic() + _HOUR_SECONDS)
+
+    def refresh(self, now: float) -> None:
+        """Reset expired daily/hourly windows."""
+        if self.daily_reset < now:
+            self.daily_count = 0
+            self.daily_reset = now + _DAY_SECONDS
+        if self.hourly_reset < now:
+            self.hourly_count = 0
+            self.hourly_reset = now + _HOUR_SECONDS
+
+
+# In-memory storage for rate limiting
+# In production, this should be Redis or a database
+usage_storage: Dict[str, IpUsage] = {}
+
 # Track global usage
 global_usage = {"total_count": 0, "started_at": datetime.now()}
 
 
+def _format_reset(deadline: float) -> str:
+    """Convert a monotonic deadline to a wall-clock HH:MM string for messages."""
+    remaining = max(0.0, deadline - time.monotonic())
+    return (datetime.now() + timedelta(seconds=remaining)).strftime("%H:%M")
+
+
 def get_usage_stats(ip_address: str) -> Dict:
     """Get current usage stats for an IP address."""
-    if ip_address not in usage_storage:
+    usage = usage_storage.get(ip_address)
+    if usage is None:
         return {
             "daily_count": 0,
             "hourly_count": 0,
@@ -32,26 +65,15 @@ def get_usage_stats(ip_address: str) -> Dict:
             "global_remaining": GLOBAL_TOTAL_LIMIT - global_usage["total_count"],
         }
 
-    usage = usage_storage[ip_address]
-    now = datetime.now()
-
-    # Reset daily count if it's a new day
-    if usage.get("daily_reset", now) < now:
-        usage["daily_count"] = 0
-        usage["daily_reset"] = now + timedelta(days=1)
-
-    # Reset hourly count if it's a new hour
-    if usage.get("hourly_reset", now) < now:
-        usage["hourly_count"] = 0
-        usage["hourly_reset"] = now + timedelta(hours=1)
+    usage.refresh(time.monotonic())
 
     return {
-        "daily_count": usage.get("daily_count", 0),
-        "hourly_count": usage.get("hourly_count", 0),
-        "total_count": usage.get("total_count", 0),
-        "daily_remaining": max(0, DAILY_LIMIT_PER_IP - usage.get("daily_count", 0)),
-        "hourly_remaining": max(0, HOURLY_LIMIT_PER_IP - usage.get("hourly_count", 0)),
-        "total_remaining": max(0, TOTAL_LIMIT_PER_IP - usage.get("total_count", 0)),
+        "daily_count": usage.daily_count,
+        "hourly_count": usage.hourly_count,
+        "total_count": usage.total_count,
+        "daily_remaining": max(0, DAILY_LIMIT_PER_IP - usage.daily_count),
+        "hourly_remaining": max(0, HOURLY_LIMIT_PER_IP - usage.hourly_count),
+        "total_remaining": max(0, TOTAL_LIMIT_PER_IP - usage.total_count),
         "global_remaining": max(0, GLOBAL_TOTAL_LIMIT - global_usage["total_count"]),
     }
 
@@ -75,45 +97,28 @@ def check_rate_limit(ip_address: str, use_user_key: bool = False) -> tuple[bool,
     if global_usage["total_count"] >= GLOBAL_TOTAL_LIMIT:
         return False, "Shared API quota exhausted. Please provide your own Anthropic API key."
 
-    # Initialize if first time
-    if ip_address not in usage_storage:
-        now = datetime.now()
-        usage_storage[ip_address] = {
-            "daily_count": 0,
-            "hourly_count": 0,
-            "total_count": 0,
-            "daily_reset": now + timedelta(days=1),
-            "hourly_reset": now + timedelta(hours=1),
-        }
-
-    usage = usage_storage[ip_address]
-    now = datetime.now()
-
-    # Reset counters if needed
-    if usage.get("daily_reset", now) < now:
-        usage["daily_count"] = 0
-        usage["daily_reset"] = now + timedelta(days=1)
+    usage = usage_storage.get(ip_address)
+    if usage is None:
+        usage = usage_storage[ip_address] = IpUsage()
 
-    if usage.get("hourly_reset", now) < now:
-        usage["hourly_count"] = 0
-        usage["hourly_reset"] = now + timedelta(hours=1)
+    usage.refresh(time.monotonic())
 
     # Check limits
-    if usage["total_count"] >= TOTAL_LIMIT_PER_IP:
+    if usage.total_count >= TOTAL_LIMIT_PER_IP:
         return (
             False,
             f"Total quota exceeded ({TOTAL_LIMIT_PER_IP} requests). Please provide your own API key for unlimited access.",
         )
 
-    if usage["daily_count"] >= DAILY_LIMIT_PER_IP:
-        reset_time = usage["daily_reset"].strftime("%H:%M")
+    if usage.daily_count >= DAILY_LIMIT_PER_IP:
+        reset_time = _format_reset(usage.daily_reset)
         return (
             False,
             f"Daily quota exceeded ({DAILY_LIMIT_PER_IP} requests/day). Resets at {reset_time}.",
         )
 
-    if usage["hourly_count"] >= HOURLY_LIMIT_PER_IP:
-        reset_time = usage["hourly_reset"].strftime("%H:%M")
+    if usage.hourly_count >= HOURLY_LIMIT_PER_IP:
+        reset_time = _format_reset(usage.hourly_reset)
         return False, f"Too many requests. Try again after {reset_time}."
 
     return True, None
@@ -129,10 +134,11 @@ def increment_usage(ip_address: str, use_user_key: bool = False):
     global_usage["total_count"] += 1
 
     # Increment IP-specific counters
-    if ip_address in usage_storage:
-        usage_storage[ip_address]["daily_count"] += 1
-        usage_storage[ip_address]["hourly_count"] += 1
-        usage_storage[ip_address]["total_count"] += 1
+    usage = usage_storage.get(ip_address)
+    if usage is not None:
+        usage.daily_count += 1
+        usage.hourly_count += 1
+        usage.total_count += 1
 
 
 def get_global_stats() -> Dict:
@@ -1,9 +1,11 @@
 """Constraint-based schedule solver using backtracking."""
 
 from collections import defaultdict
+from operator import attrgetter
 from typing import Dict, List, Set, Tuple
 
 from app.models import (
+    _DAY_BIT_OFFSET,
     AvailabilityBlock,
     DayOfWeek,
     Offering,
@@ -36,7 +38,7 @@ class ScheduleSolver:
         self.catalog = catalog
         self.request = request
         self.results: List[Schedule] = []
-        self.seen_signatures: Set[frozenset] = set()
+        self.seen_signatures: Set[tuple] = set()
 
         # Group offerings by course key
         self.offerings_by_course: Dict[str, List[Offering]] = defaultdict(list)
@@ -58,53 +60,123 @@ class ScheduleSolver:
         # Pre-filter offerings
         self._prefilter_offerings()
 
-        # Build unavailable blocks lookup
-        self.unavailable_by_day: Dict[DayOfWeek, List[Tuple[int, int]]] = defaultdict(list)
+        # All unavailable blocks folded into one packed week bitmap (same
+        # layout as Offering.time_bitmap), so the availability test is a
+        # single AND against an offering's bitmap
+        self._unavailable_bitmap = 0
         for block in request.unavailable:
-            self.unavailable_by_day[block.day].append((block.start_min, block.end_min))
+            if block.end_min > block.start_min:
+                block_mask = (1 << (block.end_min - block.start_min)) - 1
+                self._unavailable_bitmap |= block_mask << (
+                    block.start_min + _DAY_BIT_OFFSET[block.day]
+                )
+
+        # Candidate (offering, bitmap, credits) triples per course — a small
+        # structure-of-arrays view of the catalog. The recursion reads prebuilt
+        # ints and floats instead of going through Pydantic attribute access or
+        # triggering the lazy cached_property mid-search. Sections that clash
+        # with unavailable blocks are dropped here once — the availability test
+        # is per-offering and request-fixed, so re-running it at every search
+        # node was pure waste; the inner loop is left with a bitmap AND and
+        # credit arithmetic. Within a course, sections occupying fewer minutes
+        # are tried first — they conflict with less, so complete schedules
+        # surface earlier and dead branches are abandoned sooner. CRN tie-break
+        # keeps the order deterministic.
+        self._candidates: Dict[str, List[Tuple[Offering, int, float]]] = {
+            course_key: sorted(
+                (
+                    (o, o.time_bitmap, o.credits or 0.0)
+                    for o in offerings
+                    if not self._conflicts_with_availability(o)
+                ),
+                key=lambda triple: (triple[1].bit_count(), triple[0].crn),
+            )
+            for course_key, offerings in self.offerings_by_course.items()
+        }
+
+        # Meetings pre-grouped by day per offering as plain (start, end) int
+        # tuples, so the gap scoring at the recursion leaves just merges day
+        # lists instead of re-grouping every meeting on every leaf
+        self._meetings_by_day: Dict[int, Dict[DayOfWeek, List[Tuple[int, int]]]] = {}
+        for offerings in self.offerings_by_course.values():
+            for offering in offerings:
+                self._meetings_by_day[id(offering)] = self._group_meetings(offering)
+        for offering in self.required_crn_offerings:
+            self._meetings_by_day.setdefault(
+                id(offering), self._group_meetings(offering)
+            )
+
+    @staticmethod
+    def _group_meetings(offering: Offering) -> Dict[DayOfWeek, List[Tuple[int, int]]]:
+        """Group an offering's meetings by day as (start_min, end_min) tuples."""
+        by_day: Dict[DayOfWeek, List[Tuple[int, int]]] = {}
+        for meeting in offering.meetings:
+            by_day.setdefault(meeting.day, []).append(
+                (meeting.start_min, meeting.end_min)
+            )
+        return by_day
 
     def _prefilter_offerings(self):
         """Pre-filter offerings based on request filters."""
         filters = self.request.filters
 
+        # Hoist filter state out of the per-offering loop: set membership for
+        # the enums, pre-lowercased needles for the substring matches, and
+        # locals for the repeatedly-read Pydantic fields
+        allowed_status = set(filters.status)
+        allowed_delivery = set(filters.delivery) if filters.delivery else None
+        avoid_instructors = (
+            [a.lower() for a in filters.avoid_instructors]
+            if filters.avoid_instructors
+            else None
+        )
+        campus_exclude = (
+            [c.lower() for c in filters.campus_exclude] if filters.campus_exclude else None
+        )
+        campus_include = (
+            [c.lower() for c in filters.campus_include] if filters.campus_include else None
+        )
+        earliest_start = filters.earliest_start
+        latest_end = filters.latest_end
+        check_time_window = earliest_start is not None or latest_end is not None
+        include_honors = filters.include_honors
+        include_non_honors = filters.include_non_honors
+
         for course_key, offerings in self.offerings_by_course.items():
             filtered = []
             for offering in offerings:
                 # Status filter
-                if offering.status not in filters.status:
+                if offering.status not in allowed_status:
                     continue
 
                 # Delivery filter
-                if filters.delivery and offering.delivery not in filters.delivery:
+                if allowed_delivery is not None and offering.delivery not in allowed_delivery:
                     continue
 
                 # Instructor filters
-                if filters.avoid_instructors and offering.instructor:
-                    if any(
-                        avoid.lower() in offering.instructor.lower()
-                        for avoid in filters.avoid_instructors
-                    ):
+                if avoid_instructors and offering.instructor:
+                    instructor_lower = offering.instructor.lower()
+                    if any(avoid in instructor_lower for avoid in avoid_instructors):
                         continue
 
                 # Campus filters (check location of meetings)
-                if filters.campus_exclude and offering.meetings:
+                meetings = offering.meetings
+                if campus_exclude and meetings:
                     exclude = False
-                    for meeting in offering.meetings:
+                    for meeting in meetings:
                         if meeting.location and any(
-                            campus.lower() in meeting.location.lower()
-                            for campus in filters.campus_exclude
+                            campus in meeting.location.lower() for campus in campus_exclude
                         ):
                             exclude = True
                             break
                     if exclude:
                         continue
 
-                if filters.campus_include and offering.meetings:
+                if campus_include and meetings:
                     include = False
-                    for meeting in offering.meetings:
+                    for meeting in meetings:
                         if meeting.location and any(
-                            campus.lower() in meeting.location.lower()
-                            for campus in filters.campus_include
+                            campus in meeting.location.lower() for campus in campus_include
                         ):
                             include = True
                             break
@@ -112,28 +184,23 @@ class ScheduleSolver:
                         continue
 
                 # Time window filters
-                if filters.earliest_start is not None or filters.latest_end is not None:
+                if check_time_window:
                     valid_time = True
-                    for meeting in offering.meetings:
-                        if (
-                            filters.earliest_start is not None
-                            and meeting.start_min < filters.earliest_start
-                        ):
+                    for meeting in meetings:
+                        if earliest_start is not None and meeting.start_min < earliest_start:
                             valid_time = False
                             break
-                        if (
-                            filters.latest_end is not None
-                            and meeting.end_min > filters.latest_end
-                        ):
+                        if latest_end is not None and meeting.end_min > latest_end:
                             valid_time = False
                             break
                     if not valid_time:
                         continue
 
                 # Honors filter
-                if offering.is_honors and not filters.include_honors:
-                    continue
-                if not offering.is_honors and not filters.include_non_honors:
+                if offering.is_honors:
+                    if not include_honors:
+                        continue
+                elif not include_non_honors:
                     continue
 
                 filtered.append(offering)
@@ -177,16 +244,33 @@ class ScheduleSolver:
                 # No valid offerings for this course
                 return []
 
-        # Start backtracking with required CRNs already in schedule
-        self._backtrack(required_courses, 0, self.required_crn_offerings.copy())
+        # Start backtracking with required CRNs already in schedule.
+        # The running bitmap is the union of all scheduled meeting minutes, so
+        # the hot conflict test inside the recursion is one AND on plain ints
+        # rather than attribute walks over the Pydantic models.
+        used_bitmap = 0
+        base_credits = 0.0
+        for offering in self.required_crn_offerings:
+            used_bitmap |= offering.time_bitmap
+            if offering.credits is not None:
+                base_credits += offering.credits
+        self._backtrack(
+            required_courses, 0, self.required_crn_offerings.copy(), used_bitmap, base_credits
+        )
 
-        # Sort by score (lower is better)
-        self.results.sort(key=lambda s: s.score)
+        # Sort by score (lower is better); attrgetter skips a Python frame
+        # per comparison key
+        self.results.sort(key=attrgetter("score"))
 
         return self.results[: self.request.max_results]
 
     def _backtrack(
-        self, course_keys: List[str], course_idx: int, current_schedule: List[Offering]
+        self,
+        course_keys: List[str],
+        course_idx: int,
+        current_schedule: List[Offering],
+        used_bitmap: int,
+        current_credits: float,
     ):
         """
         Recursive backtracking to build schedules.
@@ -195,20 +279,21 @@ class ScheduleSolver:
             course_keys: Ordered list of required course keys
             course_idx: Current course index being processed
             current_schedule: Current partial schedule
+            used_bitmap: Union of time bitmaps of everything in current_schedule
+            current_credits: Running credit total of current_schedule
         """
         # Base case: all courses scheduled
         if course_idx >= len(course_keys):
-            # Check credits constraint
-            total_credits = sum(
-                o.credits for o in current_schedule if o.credits is not None
-            )
+            total_credits = current_credits
+            # max_credits violations are pruned inside the recursion; only the
+            # minimum needs a final check once the schedule is complete
             if self.request.min_credits and total_credits < self.request.min_credits:
                 return
-            if self.request.max_credits and total_credits > self.request.max_credits:
-                return
 
-            # Check for duplicate signature
-            sig = frozenset(o.crn for o in current_schedule)
+            # Check for duplicate signature. Course order is fixed for the whole
+            # search, so a plain tuple is equivalent to the old frozenset but
+            # cheaper to build and hash.
+            sig = tuple(o.crn for o in current_schedule)
             if sig in self.seen_signatures:
                 return
             self.seen_signatures.add(sig)
@@ -231,29 +316,31 @@ class ScheduleSolver:
 
         # Recursive case: try each offering for current course
         course_key = course_keys[course_idx]
-        offerings = self.offerings_by_course.get(course_key, [])
+        candidates = self._candidates.get(course_key, ())
 
-        for offering in offerings:
-            # Check for conflicts with current schedule
-            if self._has_conflict(offering, current_schedule):
+        max_credits = self.request.max_credits
+        for offering, offering_bitmap, offering_credits in candidates:
+            # Check for conflicts with current schedule (single bitmap AND)
+            if used_bitmap & offering_bitmap:
                 continue
 
-            # Check availability conflicts (strict - no violations allowed)
-            if self._conflicts_with_availability(offering):
+            # Prune over-credit branches before descending into them
+            new_credits = current_credits + offering_credits
+            if max_credits and new_credits > max_credits:
                 continue
 
-            # Add to schedule and recurse
+            # Add to schedule and recurse (availability conflicts were
+            # filtered out of the candidate lists at init)
             current_schedule.append(offering)
-            self._backtrack(course_keys, course_idx + 1, current_schedule)
+            self._backtrack(
+                course_keys,
+                course_idx + 1,
+                current_schedule,
+                used_bitmap | offering_bitmap,
+                new_credits,
+            )
             current_schedule.pop()
 
-    def _has_conflict(self, offering: Offering, schedule: List[Offering]) -> bool:
-        """Check if offering conflicts with any offering in the schedule."""
-        for existing in schedule:
-            if offering.overlaps_with(existing):
-                return True
-        return False
-
     def _conflicts_with_availability(self, offering: Offering) -> bool:
         """
         Check if offering conflicts with any unavailable time blocks (strict check).
@@ -264,13 +351,9 @@ class ScheduleSolver:
         Returns:
             True if there are any conflicts, False otherwise
         """
-        for meeting in offering.meetings:
-            unavailable_blocks = self.unavailable_by_day.get(meeting.day, [])
-            for unavail_start, unavail_end in unavailable_blocks:
-                conflicts, _ = meeting.conflicts_with_unavailable(unavail_start, unavail_end)
-                if conflicts:
-                    return True
-        return False
+        # One AND between the offering's packed week bitmap and the request's
+        # precomputed unavailable bitmap replaces the meeting x block loop
+        return (offering.time_bitmap & self._unavailable_bitmap) != 0
 
     def _compute_score(self, schedule: List[Offering]) -> float:
         """
@@ -317,8 +400,8 @@ class ScheduleSolver:
         total_seats = sum(offering.seats_available or 0 for offering in schedule)
         score -= total_seats * 1.0
 
-        # Tie-break: deterministic by sorted CRNs
-        crn_sum = sum(int(o.crn) if o.crn.isdigit() else hash(o.crn) for o in schedule)
+        # Tie-break: deterministic by sorted CRNs (parsed once per offering)
+        crn_sum = sum(o.crn_int for o in schedule)
         score += (crn_sum % 1000) * 0.001
 
         return score
@@ -332,11 +415,16 @@ class ScheduleSolver:
         Returns:
             Total gap minutes
         """
-        # Group meetings by day
-        meetings_by_day: Dict[DayOfWeek, List[Tuple[int, int]]] = defaultdict(list)
+        # Merge each offering's precomputed per-day lists; no per-meeting
+        # regrouping happens here
+        meetings_by_day: Dict[DayOfWeek, List[Tuple[int, int]]] = {}
         for offering in schedule:
-            for meeting in offering.meetings:
-                meetings_by_day[meeting.day].append((meeting.start_min, meeting.end_min))
+            for day, spans in self._meetings_by_day[id(offering)].items():
+                bucket = meetings_by_day.get(day)
+                if bucket is None:
+                    meetings_by_day[day] = list(spans)
+                else:
+                    bucket.extend(spans)
 
         total_gap = 0
         max_gap = self.request.filters.max_gap_min
@@ -31,6 +31,11 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _list_csvs(directory: Path) -> List[Path]:
+    """One scandir pass with a suffix check; cheaper than glob's fnmatch."""
+    return [p for p in directory.iterdir() if p.suffix == ".csv"]
+
+
 def _worker(subjects: List[str], term: Optional[str], scrape_subdir: str, headless: bool) -> int:
     """
     Top-level worker function (must be module-level for multiprocessing pickling).
@@ -43,7 +48,7 @@ def _worker(subjects: List[str], term: Optional[str], scrape_subdir: str, headle
     Path(scrape_subdir).mkdir(parents=True, exist_ok=True)
     scraper = NJITSeleniumScraper(download_dir=scrape_subdir, headless=headless)
     scraper.scrape_subject_list(subjects=subjects, term=term, delay=1.0, restart_interval=25)
-    return len(list(Path(scrape_subdir).glob("*.csv")))
+    return len(_list_csvs(Path(scrape_subdir)))
 
 
 class ScheduleUpdater:
@@ -78,9 +83,9 @@ class ScheduleUpdater:
         self.scrape_dir.mkdir(parents=True, exist_ok=True)
         self.catalog_dir.mkdir(parents=True, exist_ok=True)
 
-        logger.info(f"Scrape directory: {self.scrape_dir}")
-        logger.info(f"Catalog directory: {self.catalog_dir}")
-        logger.info(f"Parallel workers: {self.workers}")
+        logger.info("Scrape directory: %s", self.scrape_dir)
+        logger.info("Catalog directory: %s", self.catalog_dir)
+        logger.info("Parallel workers: %d", self.workers)
 
     def _get_all_subjects(self, term: Optional[str]) -> List[str]:
         """
@@ -111,29 +116,30 @@ class ScheduleUpdater:
           4. All CSVs are merged into self.scrape_dir when workers finish.
         """
         logger.info("=" * 60)
-        logger.info(f"Starting parallel scrape ({self.workers} workers)...")
+        logger.info("Starting parallel scrape (%d workers)...", self.workers)
         logger.info("=" * 60)
 
         try:
-            # Clear temp directory
+            # Clear temp directory (single scandir pass)
             if self.scrape_dir.exists():
-                for f in self.scrape_dir.glob("*.csv"):
-                    f.unlink()
-                for d in self.scrape_dir.glob("worker_*"):
-                    shutil.rmtree(d, ignore_errors=True)
+                for entry in self.scrape_dir.iterdir():
+                    if entry.suffix == ".csv":
+                        entry.unlink()
+                    elif entry.name.startswith("worker_"):
+                        shutil.rmtree(entry, ignore_errors=True)
 
             # Step 1: Get subject list
             subjects = self._get_all_subjects(term)
             if not subjects:
                 logger.error("No subjects found")
                 return False
-            logger.info(f"Total subjects to scrape: {len(subjects)}")
+            logger.info("Total subjects to scrape: %d", len(subjects))
 
             # Step 2: Split into interleaved chunks
             # Interleaved (round-robin) gives balanced chunks even if dept sizes vary
             chunks = [subjects[i::self.workers] for i in range(self.workers)]
             for i, chunk in enumerate(chunks):
-                logger.info(f"  Worker {i+1}: {len(chunk)} subjects")
+                logger.info("  Worker %d: %d subjects", i + 1, len(chunk))
 
             # Step 3: Run workers in parallel
             subdirs = [str(self.scrape_dir / f"worker_{i}") for i in range(self.workers)]
@@ -147,14 +153,14 @@ class ScheduleUpdater:
                     worker_idx = futures[future]
                     try:
                         count = future.result()
-                        logger.info(f"Worker {worker_idx + 1} finished: {count} CSVs")
+                        logger.info("Worker %d finished: %d CSVs", worker_idx + 1, count)
                     except Exception as e:
-                        logger.error(f"Worker {worker_idx + 1} failed: {e}", exc_info=True)
+                        logger.error("Worker %d failed: %s", worker_idx + 1, e, exc_info=True)
 
             # Step 4: Merge all worker CSVs into scrape_dir
             merged = 0
             for subdir in subdirs:
-                for csv_file in Path(subdir).glob("*.csv"):
+                for csv_file in _list_csvs(Path(subdir)):
                     shutil.move(str(csv_file), str(self.scrape_dir / csv_file.name))
                     merged += 1
 
@@ -162,57 +168,68 @@ class ScheduleUpdater:
                 logger.error("No CSV files were produced by any worker!")
                 return False
 
-            logger.info(f"Merged {merged} CSV files into {self.scrape_dir}")
+            logger.info("Merged %d CSV files into %s", merged, self.scrape_dir)
             return True
 
         except Exception as e:
-            logger.error(f"Error during scraping: {e}", exc_info=True)
+            logger.error("Error during scraping: %s", e, exc_info=True)
             return False
 
     def update_catalog(self, backup: bool = True) -> bool:
         """
         Update the catalog directory with newly scraped files.
+
+        The new files are staged in a sibling directory and swapped in with
+        directory renames: the old catalog becomes the backup in one rename
+        and the staging dir becomes the catalog in another. That's two inode
+        operations instead of copying every CSV twice, and the API never
+        observes a half-written catalog.
         """
         logger.info("=" * 60)
         logger.info("Updating catalog directory...")
         logger.info("=" * 60)
 
         try:
-            if backup:
-                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                backup_dir = self.catalog_dir.parent / f"courseschedules_backup_{timestamp}"
-                if list(self.catalog_dir.glob("*.csv")):
-                    shutil.copytree(self.catalog_dir, backup_dir)
-                    logger.info(f"Backed up existing catalog to: {backup_dir}")
-
-            for file in self.catalog_dir.glob("*.csv"):
-                file.unlink()
-            logger.info("Cleared current catalog directory")
-
-            csv_files = list(self.scrape_dir.glob("*.csv"))
+            csv_files = _list_csvs(self.scrape_dir)
             if not csv_files:
                 logger.error("No CSV files to copy to catalog!")
                 return False
 
-            copied = 0
-            for file in csv_files:
-                dest = self.catalog_dir / file.name
-                shutil.copy2(file, dest)
-                copied += 1
+            # Stage the new catalog next to the live one (same filesystem, so
+            # the moves below are renames, not byte copies)
+            staging_dir = self.catalog_dir.parent / "courseschedules_staging"
+            if staging_dir.exists():
+                shutil.rmtree(staging_dir)
+            staging_dir.mkdir(parents=True)
 
-            logger.info(f"Copied {copied} CSV files to catalog directory")
+            for file in csv_files:
+                shutil.move(str(file), str(staging_dir / file.name))
 
-            metadata_file = self.catalog_dir / "_update_metadata.txt"
+            metadata_file = staging_dir / "_update_metadata.txt"
             with open(metadata_file, 'w') as f:
                 f.write(f"Last Updated: {datetime.now().isoformat()}\n")
-                f.write(f"File Count: {copied}\n")
+                f.write(f"File Count: {len(csv_files)}\n")
                 f.write(f"Update Method: Parallel Selenium ({self.workers} workers)\n")
 
+            # Swap: old catalog becomes the backup (or is removed), staging
+            # becomes the live catalog
+            if self.catalog_dir.exists():
+                if backup and _list_csvs(self.catalog_dir):
+                    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+                    backup_dir = self.catalog_dir.parent / f"courseschedules_backup_{timestamp}"
+                    self.catalog_dir.rename(backup_dir)
+                    logger.info("Backed up existing catalog to: %s", backup_dir)
+                else:
+                    shutil.rmtree(self.catalog_dir)
+                    logger.info("Cleared current catalog directory")
+            staging_dir.rename(self.catalog_dir)
+
+            logger.info("Moved %d CSV files into catalog directory", len(csv_files))
             logger.info("Catalog update complete!")
             return True
 
         except Exception as e:
-            logger.error(f"Error updating catalog: {e}", exc_info=True)
+            logger.error("Error updating catalog: %s", e, exc_info=True)
             return False
 
     def run_update_cycle(
@@ -227,8 +244,8 @@ class ScheduleUpdater:
         logger.info("\n" + "=" * 60)
         logger.info("STARTING AUTOMATED UPDATE CYCLE")
         logger.info("=" * 60)
-        logger.info(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        logger.info(f"Term: {term or 'Default (current term)'}")
+        logger.info("Time: %s", datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+        logger.info("Term: %s", term or 'Default (current term)')
 
         try:
             if not self.scrape_latest_data(term):
@@ -242,13 +259,13 @@ class ScheduleUpdater:
             elapsed = time.time() - start_time
             logger.info("\n" + "=" * 60)
             logger.info("UPDATE CYCLE COMPLETED SUCCESSFULLY")
-            logger.info(f"Total time: {elapsed:.2f} seconds ({elapsed/60:.1f} min)")
+            logger.info("Total time: %.2f seconds (%.1f min)", elapsed, elapsed / 60)
             logger.info("=" * 60 + "\n")
 
             return True
 
         except Exception as e:
-            logger.error(f"Update cycle failed: {e}", exc_info=True)
+            logger.error("Update cycle failed: %s", e, exc_info=True)
             return False
 
 
@@ -3,35 +3,64 @@
 Combine all course schedule CSVs into one master file and check room availability.
 """
 
+import numpy as np
 import pandas as pd
-import glob
 import os
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 
+
+def _read_schedule_csv(csv_file: str) -> pd.DataFrame:
+    """Module-level reader so ProcessPoolExecutor can pickle it."""
+    # dtype=str skips the per-column dtype-inference pass (which reads
+    # every column twice) — the combined file is written back out as
+    # text anyway, so nothing downstream needs inferred numerics
+    return pd.read_csv(csv_file, dtype=str, engine="c")
+
 def combine_all_schedules(input_dir: str, output_file: str):
     """Combine all CSV files from input directory into one master CSV."""
 
-    # Get all CSV files
-    csv_files = glob.glob(os.path.join(input_dir, "*.csv"))
+    # Get all CSV files — one scandir pass with a suffix check, instead of
+    # glob's per-entry fnmatch
+    csv_files = [e.path for e in os.scandir(input_dir) if e.is_file() and e.name.endswith('.csv')]
     print(f"Found {len(csv_files)} CSV files to combine")
 
-    # Read and combine all CSVs
+    # Parse the CSVs across CPU cores; parsing is CPU-bound, so a process
+    # pool scales with core count. Arrival order is irrelevant — the frame
+    # is re-sorted after the concat anyway.
     all_data = []
-    for csv_file in csv_files:
-        try:
-            df = pd.read_csv(csv_file)
-            all_data.append(df)
-            print(f"  Loaded {len(df)} courses from {os.path.basename(csv_file)}")
-        except Exception as e:
-            print(f"  ERROR reading {csv_file}: {e}")
-
-    # Combine all dataframes
+    with ProcessPoolExecutor() as executor:
+        futures = {executor.submit(_read_schedule_csv, f): f for f in csv_files}
+        for future in as_completed(futures):
+            csv_file = futures[future]
+            try:
+                df = future.result()
+                all_data.append(df)
+                print(f"  Loaded {len(df)} courses from {os.path.basename(csv_file)}")
+            except Exception as e:
+                print(f"  ERROR reading {csv_file}: {e}")
+
+    # Combine all dataframes in one pass, without re-copying column blocks
     if all_data:
-        combined_df = pd.concat(all_data, ignore_index=True)
+        combined_df = pd.concat(all_data, ignore_index=True, copy=False)
         print(f"\nTotal courses: {len(combined_df)}")
 
-        # Sort by course code for easier reading
-        combined_df = combined_df.sort_values(['Course', 'Section'])
+        # Low-cardinality filter columns go categorical: str.contains then
+        # scans the small categories array once and maps results back through
+        # the integer codes, instead of touching every row's string
+        for col in ('Days', 'Instructor', 'Location', 'Status', 'Delivery Mode'):
+            if col in combined_df.columns:
+                combined_df[col] = combined_df[col].astype('category')
+
+        # Sort by course code for easier reading. np.lexsort computes the
+        # (Course, Section) order in one stable C pass; take() then reorders
+        # all columns at once, avoiding sort_values' multi-column comparator
+        order = np.lexsort((
+            combined_df['Section'].to_numpy(),
+            combined_df['Course'].to_numpy(),
+        ))
+        combined_df = combined_df.take(order)
 
         # Save to output file
         combined_df.to_csv(output_file, index=False)
@@ -51,20 +80,45 @@ def check_room_availability(df: pd.DataFrame, rooms: list, day: str, time: str):
 
     results = {}
 
+    # The day/time predicates don't depend on the room, so reduce the frame to
+    # the Tuesday candidate rows once; every per-room scan then runs over that
+    # (much smaller) subset instead of the full catalog.
+    # Need to be careful: T is Tuesday, R is Thursday — checking 'T' in Days
+    # covers TR, TF, etc.
+    tuesday_df = df.loc[df['Days'].str.contains('T', na=False, regex=False).to_numpy()]
+
+    # Bucket the Tuesday rows by time token ("8:30 AM" etc.) once; each time
+    # query is then a dict lookup instead of another substring scan of Times,
+    # which amortizes nicely if more (room, time) combinations get checked
+    time_idx = defaultdict(list)
+    for pos, times in enumerate(tuesday_df['Times'].to_numpy()):
+        for token in str(times).replace(',', ' - ').split(' - '):
+            time_idx[token.strip()].append(pos)
+    morning_mask = np.zeros(len(tuesday_df), dtype=bool)
+    morning_mask[time_idx[time]] = True
+
+    # Match every requested room against Location in a single pass, and
+    # case-normalize each *distinct* location exactly once: Location is
+    # categorical, so uppercase the (small) categories array, match rooms
+    # against that, and expand to per-row masks through the integer codes.
+    loc_col = tuesday_df['Location']
+    if loc_col.dtype != 'category':
+        loc_col = loc_col.astype('category')
+    location_codes = loc_col.cat.codes.to_numpy()
+    categories_upper = [str(c).upper() for c in loc_col.cat.categories]
+    room_masks = {}
+    for room in rooms:
+        needle = room.upper()
+        matching = [code for code, cat in enumerate(categories_upper) if needle in cat]
+        room_masks[room] = np.isin(location_codes, matching)
+
     for room in rooms:
         print(f"\nRoom: {room}")
         print(f"-" * 80)
 
-        # Filter for this room
-        room_classes = df[df['Location'].str.contains(room, na=False, case=False)]
-
-        # Filter for Tuesday classes (Days contains 'T')
-        # Need to be careful: T is Tuesday, R is Thursday
-        # So we check if 'T' is in Days but handle TR, TF, etc.
-        tuesday_classes = room_classes[room_classes['Days'].str.contains('T', na=False)]
-
-        # Filter for 8:30 AM classes
-        morning_classes = tuesday_classes[tuesday_classes['Times'].str.contains('8:30 AM', na=False)]
+        room_mask = room_masks[room]
+        tuesday_classes = tuesday_df.loc[room_mask]
+        morning_classes = tuesday_df.loc[room_mask & morning_mask]
 
         if len(morning_classes) == 0:
             print(f"✓ AVAILABLE - No classes scheduled in {room} on Tuesdays at 8:30 AM")
@@ -74,11 +128,12 @@ def check_room_availability(df: pd.DataFrame, rooms: list, day: str, time: str):
             }
         else:
             print(f"✗ OCCUPIED - {len(morning_classes)} class(es) scheduled:")
-            for idx, row in morning_classes.iterrows():
-                print(f"  - {row['Course']}-{row['Section']}: {row['Title']}")
-                print(f"    Instructor: {row['Instructor']}")
-                print(f"    Days: {row['Days']}, Times: {row['Times']}")
-                print(f"    Enrollment: {row['Now']}/{row['Max']}")
+            # itertuples avoids the per-row Series construction of iterrows
+            for row in morning_classes.itertuples(index=False):
+                print(f"  - {row.Course}-{row.Section}: {row.Title}")
+                print(f"    Instructor: {row.Instructor}")
+                print(f"    Days: {row.Days}, Times: {row.Times}")
+                print(f"    Enrollment: {row.Now}/{row.Max}")
                 print()
 
             results[room] = {
@@ -89,8 +144,8 @@ def check_room_availability(df: pd.DataFrame, rooms: list, day: str, time: str):
         # Also show all Tuesday classes in this room for context
         if len(tuesday_classes) > 0:
             print(f"\nAll Tuesday classes in {room}:")
-            for idx, row in tuesday_classes.iterrows():
-                print(f"  - {row['Times']}: {row['Course']}-{row['Section']} ({row['Instructor']})")
+            for row in tuesday_classes.itertuples(index=False):
+                print(f"  - {row.Times}: {row.Course}-{row.Section} ({row.Instructor})")
 
     return results
 
@@ -102,33 +157,36 @@ def find_steve_kane_class(df: pd.DataFrame):
     print(f"{'='*80}\n")
 
     # Search for Steve Kane as instructor
-    kane_classes = df[df['Instructor'].str.contains('Kane', na=False, case=False)]
+    kane_classes = df[df['Instructor'].str.contains('Kane', na=False, case=False, regex=False)]
 
     if len(kane_classes) > 0:
         print(f"Found {len(kane_classes)} class(es) with Kane as instructor:")
-        for idx, row in kane_classes.iterrows():
-            print(f"  - {row['Course']}-{row['Section']}: {row['Title']}")
-            print(f"    Days: {row['Days']}, Times: {row['Times']}")
-            print(f"    Location: {row['Location']}")
-            print(f"    Enrollment: {row['Now']}/{row['Max']}")
+        for row in kane_classes.itertuples(index=False):
+            print(f"  - {row.Course}-{row.Section}: {row.Title}")
+            print(f"    Days: {row.Days}, Times: {row.Times}")
+            print(f"    Location: {row.Location}")
+            print(f"    Enrollment: {row.Now}/{row.Max}")
             print()
         return kane_classes
     else:
         print("No classes found with 'Kane' as instructor.")
         print("Searching for classes in KUPF 211 on Tuesday at 8:30 AM...")
 
-        kupf211_classes = df[
-            (df['Location'].str.contains('KUPF 211', na=False, case=False)) &
-            (df['Days'].str.contains('T', na=False)) &
-            (df['Times'].str.contains('8:30 AM', na=False))
-        ]
+        # Combine the three predicates as ndarrays in one reduce instead of
+        # chained Series __and__, which materializes an intermediate boolean
+        # Series (with index alignment) per &
+        kupf211_classes = df.loc[np.logical_and.reduce([
+            df['Location'].str.contains('KUPF 211', na=False, case=False, regex=False).to_numpy(),
+            df['Days'].str.contains('T', na=False, regex=False).to_numpy(),
+            df['Times'].str.contains('8:30 AM', na=False, regex=False).to_numpy(),
+        ])]
 
         if len(kupf211_classes) > 0:
             print(f"\nFound {len(kupf211_classes)} class(es) in KUPF 211 on Tuesday at 8:30 AM:")
-            for idx, row in kupf211_classes.iterrows():
-                print(f"  - {row['Course']}-{row['Section']}: {row['Title']}")
-                print(f"    Instructor: {row['Instructor']}")
-                print(f"    Enrollment: {row['Now']}/{row['Max']}")
+            for row in kupf211_classes.itertuples(index=False):
+                print(f"  - {row.Course}-{row.Section}: {row.Title}")
+                print(f"    Instructor: {row.Instructor}")
+                print(f"    Enrollment: {row.Now}/{row.Max}")
                 print()
             return kupf211_classes
         else:
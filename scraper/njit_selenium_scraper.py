@@ -2,6 +2,12 @@
 """
 NJIT Course Schedule Scraper using Selenium
 Automates browser interaction to download course schedule CSVs for all subjects.
+
+Prefer njit_course_scraper.NJITCourseScraper where possible: it calls the same
+REST endpoints the page itself uses (stuRegCrseSchedSubjList,
+stuRegCrseSchedSectionsExcel) directly over HTTP, with no Chrome process,
+AngularJS rendering, or download polling. This module is the fallback for when
+those endpoints are unavailable or change shape.
 """
 
 import time
@@ -10,10 +16,15 @@ from pathlib import Path
 from datetime import datetime
 import logging
 from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait, Select
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import (
+    TimeoutException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+)
 
 # Setup logging
 logging.basicConfig(
@@ -28,13 +39,27 @@ class NJITSeleniumScraper:
 
     URL = "https://generalssb-prod.ec.njit.edu/BannerExtensibility/customPage/page/stuRegCrseSched"
 
-    def __init__(self, download_dir: str = None, headless: bool = False):
+    def __init__(self, download_dir: str = None, headless: bool = False,
+                 attach_to: str = None, shm_ok: bool = True,
+                 no_sandbox: bool = False, driver_path: str = None):
         """
         Initialize the scraper.
 
         Args:
             download_dir: Directory for downloaded CSV files
             headless: Run browser in headless mode (no visible window)
+            attach_to: "host:port" of an already-running Chrome with remote
+                debugging enabled (see launch_persistent_chrome). Attaching
+                skips the 1-3s cold start and reuses the browser's RSS.
+            shm_ok: /dev/shm is adequately sized (true everywhere except
+                small containers). Set False to pass --disable-dev-shm-usage,
+                which routes renderer shared memory through /tmp and slows
+                every DOM operation; in Docker, prefer --shm-size=2g instead.
+            no_sandbox: Pass --no-sandbox (required when Chrome runs as
+                root; disables the renderer sandbox).
+            driver_path: Pinned chromedriver binary. When set, start_driver
+                skips Selenium Manager's per-process resolution entirely
+                (see resolve_driver_once).
         """
         if download_dir is None:
             download_dir = str(Path.cwd() / "data" / "scraped")
@@ -42,34 +67,78 @@ class NJITSeleniumScraper:
         self.download_dir = Path(download_dir).absolute()
         self.download_dir.mkdir(parents=True, exist_ok=True)
 
+        self.attach_to = attach_to
+        self.driver_path = driver_path
+
         # Setup Chrome options
         self.options = webdriver.ChromeOptions()
-        if headless:
-            self.options.add_argument('--headless=new')
-
-        # Set download directory
-        prefs = {
-            "download.default_directory": str(self.download_dir),
-            "download.prompt_for_download": False,
-            "download.directory_upgrade": True,
-            "safebrowsing.enabled": True
-        }
-        self.options.add_experimental_option("prefs", prefs)
-
-        # Additional options for stability
-        self.options.add_argument('--no-sandbox')
-        self.options.add_argument('--disable-dev-shm-usage')
-        self.options.add_argument('--disable-blink-features=AutomationControlled')
-        self.options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        self.options.add_experimental_option('useAutomationExtension', False)
+        # Return from driver.get at DOMContentLoaded instead of window.onload:
+        # on the AngularJS page the elements we need exist well before onload,
+        # and the explicit WebDriverWaits are the real readiness gate
+        self.options.page_load_strategy = 'eager'
+        if attach_to:
+            # Reconnect to a long-lived Chrome instead of launching one; all
+            # other options belong to the process that started the browser
+            self.options.add_experimental_option("debuggerAddress", attach_to)
+        else:
+            if headless:
+                self.options.add_argument('--headless=new')
+
+            # Set download directory
+            prefs = {
+                "download.default_directory": str(self.download_dir),
+                "download.prompt_for_download": False,
+                "download.directory_upgrade": True,
+                "safebrowsing.enabled": True
+            }
+            self.options.add_experimental_option("prefs", prefs)
+
+            # Additional options for stability
+            if no_sandbox:
+                self.options.add_argument('--no-sandbox')
+            if not shm_ok:
+                # Correctness fallback for undersized /dev/shm, at a real
+                # cost to renderer IPC — only on explicit request
+                self.options.add_argument('--disable-dev-shm-usage')
+            self.options.add_argument('--disable-blink-features=AutomationControlled')
+            self.options.add_experimental_option("excludeSwitches", ["enable-automation"])
+            self.options.add_experimental_option('useAutomationExtension', False)
 
         self.driver = None
+        # Subject text -> WebElement cache built by get_subjects; the table
+        # is static for a term, so clicks reuse it instead of re-querying
+        self._subject_links = None
+        # Set by download_excel just before the export click; lets
+        # wait_for_download tell this download's file apart from the CSVs
+        # accumulated by earlier subjects
+        self._download_started = None
 
     def start_driver(self):
         """Initialize and start the Chrome driver."""
         try:
-            self.driver = webdriver.Chrome(options=self.options)
+            if self.driver_path:
+                # Pinned driver: no Selenium Manager resolution on this start
+                service = Service(executable_path=self.driver_path)
+                self.driver = webdriver.Chrome(service=service, options=self.options)
+            else:
+                self.driver = webdriver.Chrome(options=self.options)
             self.driver.set_page_load_timeout(120)  # Increased to 120 seconds
+
+            # The scraper only needs the page HTML and the JSON calls
+            # AngularJS makes; block images/fonts/analytics at the network
+            # layer so page loads (one per restart) transfer fewer bytes.
+            # CSS stays enabled — the explicit waits rely on element
+            # visibility, which blocked stylesheets would break.
+            try:
+                self.driver.execute_cdp_cmd("Network.enable", {})
+                self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": [
+                    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.ico", "*.svg",
+                    "*.woff", "*.woff2", "*.ttf",
+                    "*google-analytics*", "*doubleclick*",
+                ]})
+            except Exception as cdp_error:
+                logger.warning(f"Could not enable CDP resource blocking: {cdp_error}")
+
             logger.info("Chrome driver started successfully")
         except Exception as e:
             logger.error(f"Failed to start Chrome driver: {e}")
@@ -93,8 +162,12 @@ class NJITSeleniumScraper:
                 WebDriverWait(self.driver, 60).until(
                     EC.presence_of_element_located((By.ID, "pbid-selectBlockTermSelect"))
                 )
+                # The subject table appears once AngularJS has finished
+                # initializing, so wait for that instead of a fixed sleep
+                WebDriverWait(self.driver, 30).until(
+                    EC.presence_of_element_located((By.ID, "pbid-subjListTable"))
+                )
                 logger.info("Page loaded successfully")
-                time.sleep(3)  # Additional wait for AngularJS to initialize
                 return  # Success!
 
             except TimeoutException as e:
@@ -132,15 +205,31 @@ class NJITSeleniumScraper:
             term_select = Select(self.driver.find_element(By.ID, "pbid-selectBlockTermSelect"))
 
             if term:
-                term_select.select_by_value(term)
-                logger.info(f"Selected term: {term}")
+                # Skip the re-select (and the table re-render it triggers)
+                # when the requested term is already the selected one —
+                # common on restarts and default-term runs
+                current = term_select.first_selected_option.get_attribute('value')
+                if current == term:
+                    logger.info(f"Term already selected: {term}")
+                else:
+                    term_select.select_by_value(term)
+                    logger.info(f"Selected term: {term}")
+                    # The table re-renders for the new term, so cached links
+                    # are stale
+                    self._subject_links = None
             else:
                 # Use the default selected term
                 selected_option = term_select.first_selected_option
                 term_value = selected_option.get_attribute('value')
                 logger.info(f"Using default term: {term_value}")
 
-            time.sleep(2)  # Wait for data to load
+            # Block until the subject table has rows for the selected term;
+            # returns the moment data is there instead of a fixed 2s wait
+            WebDriverWait(self.driver, 30).until(
+                EC.presence_of_element_located(
+                    (By.CSS_SELECTOR, "#pbid-subjListTable tbody tr td a")
+                )
+            )
         except Exception as e:
             logger.error(f"Failed to select term: {e}")
             raise
@@ -158,11 +247,8 @@ class NJITSeleniumScraper:
                 EC.presence_of_element_located((By.ID, "pbid-subjListTable"))
             )
 
-            # Find all subject link elements
-            subject_table = self.driver.find_element(By.ID, "pbid-subjListTable")
-            subject_links = subject_table.find_elements(By.CSS_SELECTOR, "tbody tr td a")
-
-            subjects = [link.text.strip() for link in subject_links if link.text.strip()]
+            self._refresh_subject_links()
+            subjects = list(self._subject_links)
 
             logger.info(f"Found {len(subjects)} subjects")
             return subjects
@@ -171,38 +257,63 @@ class NJITSeleniumScraper:
             logger.error(f"Failed to get subjects: {e}")
             return []
 
+    def _refresh_subject_links(self):
+        """Re-query the subject table and rebuild the text -> element cache."""
+        # A single executeScript returns (text, element) pairs in one
+        # WebDriver roundtrip, instead of find_elements plus one .text
+        # command per link (~100 roundtrips per refresh)
+        pairs = self.driver.execute_script(
+            "return Array.from(document.querySelectorAll("
+            "'#pbid-subjListTable tbody tr td a'))"
+            ".map(a => [a.textContent.trim(), a])"
+            ".filter(p => p[0]);"
+        )
+        self._subject_links = {text: link for text, link in pairs}
+
+    def _click_link(self, subject_text: str, link):
+        """Scroll a subject link into view and click it (JS click fallback)."""
+        self.driver.execute_script("arguments[0].scrollIntoView(true);", link)
+        try:
+            link.click()
+        except StaleElementReferenceException:
+            raise
+        except Exception:
+            # If normal click fails, try JavaScript click
+            logger.warning(f"Normal click failed for {subject_text}, trying JavaScript click")
+            self.driver.execute_script("arguments[0].click();", link)
+
     def click_subject(self, subject_text: str):
         """
-        Click on a subject in the subject list.
+        Click on a subject in the subject list, using the cached link.
 
         Args:
             subject_text: The subject code to click (e.g., 'CS')
         """
         try:
-            # Find and click the subject link
-            subject_table = self.driver.find_element(By.ID, "pbid-subjListTable")
-            subject_links = subject_table.find_elements(By.CSS_SELECTOR, "tbody tr td a")
+            if not self._subject_links:
+                self._refresh_subject_links()
 
-            for link in subject_links:
-                if link.text.strip() == subject_text:
-                    # Scroll element into view
-                    self.driver.execute_script("arguments[0].scrollIntoView(true);", link)
-                    time.sleep(0.5)
+            link = self._subject_links.get(subject_text)
+            if link is None:
+                logger.warning(f"Subject not found: {subject_text}")
+                return False
 
-                    try:
-                        # Try normal click first
-                        link.click()
-                    except Exception as click_error:
-                        # If normal click fails, try JavaScript click
-                        logger.warning(f"Normal click failed for {subject_text}, trying JavaScript click")
-                        self.driver.execute_script("arguments[0].click();", link)
-
-                    logger.info(f"Clicked subject: {subject_text}")
-                    time.sleep(1)  # Wait for sections to load
-                    return True
-
-            logger.warning(f"Subject not found: {subject_text}")
-            return False
+            try:
+                self._click_link(subject_text, link)
+            except StaleElementReferenceException:
+                # Cache miss: the table was re-rendered since get_subjects,
+                # so re-query once and retry
+                self._refresh_subject_links()
+                link = self._subject_links.get(subject_text)
+                if link is None:
+                    logger.warning(f"Subject not found: {subject_text}")
+                    return False
+                self._click_link(subject_text, link)
+
+            logger.info(f"Clicked subject: {subject_text}")
+            # Callers follow up with wait_for_sections_to_load, which
+            # polls the loader; no fixed post-click sleep needed
+            return True
 
         except Exception as e:
             logger.error(f"Failed to click subject {subject_text}: {e}")
@@ -227,9 +338,11 @@ class NJITSeleniumScraper:
                 EC.element_to_be_clickable((By.ID, "pbid-courseListSectionExportToExcel"))
             )
 
+            # Timestamp taken before the click so even an instant download
+            # is seen as new by wait_for_download
+            self._download_started = time.time()
             export_button.click()
             logger.info("Clicked 'Export as Excel' button")
-            time.sleep(2)  # Wait for download to start
 
         except Exception as e:
             logger.error(f"Failed to click export button: {e}")
@@ -237,19 +350,29 @@ class NJITSeleniumScraper:
 
     def wait_for_download(self, timeout: int = 30):
         """
-        Wait for a download to complete.
+        Wait for the download triggered by the last export click to complete.
+
+        Polls with os.scandir and compares mtimes against the export-click
+        timestamp, so completion means "a new file landed and nothing is
+        still partial" — no fixed sleep before the click and no globbing of
+        every CSV accumulated by earlier subjects.
 
         Args:
             timeout: Maximum seconds to wait
         """
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            # Check if any .crdownload files exist (Chrome incomplete downloads)
-            incomplete = list(self.download_dir.glob("*.crdownload"))
-            if not incomplete:
-                time.sleep(0.5)
+        started = self._download_started or time.time()
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            in_progress = False
+            completed = False
+            for entry in os.scandir(self.download_dir):
+                if entry.name.endswith('.crdownload'):
+                    in_progress = True
+                elif entry.is_file() and entry.stat().st_mtime >= started:
+                    completed = True
+            if completed and not in_progress:
                 return True
-            time.sleep(0.5)
+            time.sleep(0.1)
 
         logger.warning("Download may not have completed")
         return False
@@ -263,8 +386,12 @@ class NJITSeleniumScraper:
             self.start_driver()
             self.load_page()
             self.select_term(term)
-            # Extra wait for page to fully settle after restart
-            time.sleep(5)
+            # The subject-code list survives the whole run in the caller;
+            # only the WebElements died with the old session, so re-bind the
+            # link cache now in a single executeScript batch
+            self._refresh_subject_links()
+            # load_page/select_term now block on explicit conditions, so the
+            # page is already settled here
             logger.info("Browser restarted successfully")
             return True
         except Exception as e:
@@ -505,6 +632,62 @@ class NJITSeleniumScraper:
             self.stop_driver()
 
 
+def resolve_driver_once(cache_file: str = None) -> str:
+    """
+    Resolve chromedriver through Selenium Manager once and cache the path.
+
+    webdriver.Chrome() runs the manager's resolution (and possibly a
+    download) on every process start; resolving up front and passing the
+    result as driver_path skips that on each start_driver — including in
+    pool workers, which should receive the path from the parent.
+    """
+    if cache_file is None:
+        cache_file = Path.home() / ".cache" / "njitscraper" / "chromedriver_path"
+    cache_file = Path(cache_file)
+
+    if cache_file.exists():
+        cached = cache_file.read_text().strip()
+        if cached and Path(cached).exists():
+            return cached
+
+    from selenium.webdriver.common.selenium_manager import SeleniumManager
+
+    paths = SeleniumManager().binary_paths(["--browser", "chrome"])
+    driver_path = paths["driver_path"]
+
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    cache_file.write_text(driver_path)
+    return driver_path
+
+
+def launch_persistent_chrome(port: int = 9222, user_data_dir: str = "/tmp/njit-chrome"):
+    """
+    Spawn one long-lived Chrome with remote debugging enabled.
+
+    Scrapers created with attach_to=f"127.0.0.1:{port}" then connect to it in
+    well under a second, instead of paying a fresh browser launch (and a fresh
+    ~200MB of RSS) per run. Returns the subprocess.Popen handle.
+    """
+    import shutil
+    import subprocess
+
+    binary = next(
+        (b for b in ("google-chrome", "chromium-browser", "chromium", "chrome")
+         if shutil.which(b)),
+        None,
+    )
+    if binary is None:
+        raise RuntimeError("No Chrome/Chromium binary found on PATH")
+
+    return subprocess.Popen([
+        shutil.which(binary),
+        f"--remote-debugging-port={port}",
+        f"--user-data-dir={user_data_dir}",
+        "--no-first-run",
+        "--no-default-browser-check",
+    ])
+
+
 def main():
     """Main entry point."""
     import argparse